@@ -0,0 +1,374 @@
+#!/usr/bin/python3
+"""Lint many files and queries in one process, reusing one warm parser.
+
+Inputs can be files, directories (searched for .cypher/.cql files), glob
+patterns and "-" for queries on stdin, one per line or NUL-separated with -0.
+Files are split into their ';'-separated statements, which are linted one
+by one.
+The exit status is 1 if any query had errors or could not be linted.
+
+With --jobs N the inputs are linted in chunks by N worker processes, each
+with its own warm parser. Results are reused from the on-disk cache in
+cache.py unless --no-cache is given.
+"""
+import argparse
+import glob
+import itertools
+import multiprocessing.util
+import os
+import sys
+import time
+
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List
+
+import instrument
+import main
+import parsing
+import snapshot
+from cache import ResultCache
+from diagnostics import RENDERERS, Diagnostic
+from splitter import Statement, splitFile
+
+CYPHER_EXTENSIONS = (".cypher", ".cql")
+
+
+@dataclass
+class Result:
+    name: str
+    diagnostics: List[Diagnostic]
+    # Anything else reported for the input, such as why it could not be
+    # checked
+    message: str = ""
+    unsupported: bool = False
+    failed: bool = False
+    cached: bool = False
+
+    @property
+    def errors(self):
+        return len(self.diagnostics)
+
+    @property
+    def ok(self):
+        return not (self.errors or self.unsupported or self.failed)
+
+    def toDict(self) -> dict:
+        """The result without its name, as stored in the cache and sent by
+        the daemon."""
+        return {
+            "diagnostics": [d.toDict() for d in self.diagnostics],
+            "message": self.message,
+            "unsupported": self.unsupported,
+            "failed": self.failed,
+        }
+
+    @classmethod
+    def fromDict(cls, name: str, value: dict, cached: bool = False) -> "Result":
+        diagnostics = [Diagnostic.fromDict(d) for d in value["diagnostics"]]
+        return cls(
+            name,
+            diagnostics,
+            value["message"],
+            value["unsupported"],
+            value["failed"],
+            cached,
+        )
+
+
+def lintOne(name: str, text: str) -> Result:
+    """Run main.lint on `text`, turning its exceptions into the Result."""
+    try:
+        return Result(name, main.lint(text))
+    except AssertionError as e:
+        return Result(name, [], f"{e}\n", unsupported=True)
+    except Exception as e:
+        # A checker bug on one query shouldn't stop the whole batch
+        return Result(name, [], f"{type(e).__name__}: {e}\n", failed=True)
+
+
+def lintCached(name: str, text: str, cache: ResultCache = None) -> Result:
+    """lintOne, replaying the stored result if `text` was linted before."""
+    if cache is None:
+        return lintOne(name, text)
+    key = cache.key(text)
+    if (value := cache.get(key)) is not None:
+        return Result.fromDict(name, value, cached=True)
+    result = lintOne(name, text)
+    cache.put(key, result.toDict())
+    return result
+
+
+def expandPath(path: str):
+    """Cypher files named by `path`: a file, a directory or a glob."""
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for f in sorted(files):
+                if f.endswith(CYPHER_EXTENSIONS):
+                    yield os.path.join(root, f)
+    elif os.path.exists(path) or not glob.has_magic(path):
+        yield path
+    else:
+        for match in sorted(glob.glob(path, recursive=True)):
+            yield from expandPath(match)
+
+
+def readQueries(stream, separator: str):
+    """Yield (name, Statement) for each non-blank query in `stream`."""
+    text = stream.read()
+    for number, query in enumerate(text.split(separator), 1):
+        if query.strip():
+            yield f"<stdin>:{number}", Statement(query, 0, 0, 0)
+
+
+def readFailure(name: str, error: Exception) -> Result:
+    return Result(name, [], f"{type(error).__name__}: {error}\n", failed=True)
+
+
+def collectInputs(paths, separator: str):
+    """Yield (name, Statement) per statement to lint, and (name, Result) for
+    inputs that could not be read or globs and directories without Cypher
+    files, so one bad path doesn't stop the batch."""
+    for path in paths:
+        if path == "-":
+            try:
+                yield from readQueries(sys.stdin, separator)
+            except UnicodeDecodeError as e:
+                yield "<stdin>", readFailure("<stdin>", e)
+            continue
+        matched = False
+        for filename in expandPath(path):
+            matched = True
+            try:
+                for statement in splitFile(filename):
+                    yield filename, statement
+            except (OSError, UnicodeDecodeError) as e:
+                yield filename, readFailure(filename, e)
+        if not matched:
+            # Most likely a typo, which shouldn't pass as a clean run
+            error = FileNotFoundError(f"No Cypher files match {path}")
+            yield path, readFailure(path, error)
+
+
+def chunked(iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _saveAtWorkerExit(save):
+    # Pool workers leave through os._exit, skipping atexit, but they do run
+    # multiprocessing's finalizers
+    multiprocessing.util.Finalize(None, save, exitpriority=0)
+
+
+def _initWorker(dfa_cache, stats: bool):
+    # Under fork the worker already has the parent's DFA, but under spawn it
+    # starts cold, so load the cache again before building the session. The
+    # parent never parses, so each worker saves what it learned itself; the
+    # last one to exit wins.
+    if dfa_cache is not None:
+        snapshot.enableDFACache(dfa_cache or None, _saveAtWorkerExit)
+    instrument.stats.enabled = stats
+    parsing.getSession()
+
+
+def lintChunk(chunk, cache=None):
+    """Lint a list of (name, text) in a worker.
+
+    Returns (pid, seconds, LL fallbacks, results, instrument.stats snapshot
+    or None when they are off).
+    """
+    start = time.perf_counter()
+    fallbacks = parsing.stats.fallbacks
+    results = [lintCached(name, text, cache) for name, text in chunk]
+    fallbacks = parsing.stats.fallbacks - fallbacks
+    stats = None
+    if instrument.stats.enabled:
+        stats = instrument.stats.snapshot()
+        instrument.stats.reset()
+    return os.getpid(), time.perf_counter() - start, fallbacks, results, stats
+
+
+def lintParallel(inputs, jobs: int, chunk_size: int, ordered: bool, dfa_cache, cache):
+    """Yield (chunk, lintChunk's result) per chunk of collectInputs' items
+    from a pool of `jobs` workers. Only the Statements are sent to them.
+
+    Only a few chunks per worker are in flight at a time, so inputs are read
+    as the workers catch up rather than all up front.
+    """
+    limit = jobs * 4
+    with ProcessPoolExecutor(
+        jobs,
+        initializer=_initWorker,
+        initargs=(dfa_cache, instrument.stats.enabled),
+    ) as pool:
+        futures = {}
+
+        def nextDone():
+            if ordered:
+                # dicts keep insertion order, so this is the oldest chunk
+                return [next(iter(futures))]
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            return done
+
+        for chunk in chunked(inputs, chunk_size):
+            texts = [
+                (name, item.text) for name, item in chunk if isinstance(item, Statement)
+            ]
+            futures[pool.submit(lintChunk, texts, cache)] = chunk
+            if len(futures) >= limit:
+                for future in nextDone():
+                    yield futures.pop(future), future.result()
+        while futures:
+            for future in nextDone():
+                yield futures.pop(future), future.result()
+
+
+def run(args) -> int:
+    separator = "\0" if args.null else "\n"
+    inputs = collectInputs(args.paths or ["-"], separator)
+    cache = None if args.no_cache else ResultCache()
+    out = sys.stderr if args.format == "text" else sys.stdout
+    renderer = RENDERERS[args.format](out)
+
+    totals = defaultdict(int)
+    workers = defaultdict(lambda: [0, 0.0])
+
+    def add(result: Result, statement: Statement = Statement("", 0, 0, 0)):
+        lines = statement.lines()
+        statement.locate(result.diagnostics, lines)
+        renderer.add(result.name, lines, result.diagnostics, result.message)
+        totals["queries"] += 1
+        totals["with errors"] += result.errors > 0
+        totals["unsupported"] += result.unsupported
+        totals["failed"] += result.failed
+        totals["cached"] += result.cached
+
+    start = time.perf_counter()
+    if args.jobs > 1:
+        chunks = lintParallel(
+            inputs,
+            args.jobs,
+            args.chunk_size,
+            not args.unordered,
+            args.dfa_cache,
+            cache,
+        )
+        for chunk, (pid, seconds, fallbacks, results, stats) in chunks:
+            workers[pid][0] += len(results)
+            workers[pid][1] += seconds
+            parsing.stats.fallbacks += fallbacks
+            if stats is not None:
+                instrument.stats.merge(stats)
+            results = iter(results)
+            for _, item in chunk:
+                if isinstance(item, Result):
+                    add(item)
+                else:
+                    add(next(results), item)
+    else:
+        for name, item in inputs:
+            if isinstance(item, Result):
+                add(item)
+            else:
+                add(lintCached(name, item.text, cache), item)
+    renderer.close()
+    elapsed = time.perf_counter() - start
+
+    if cache is not None:
+        cache.evict()
+
+    if args.summary:
+        rate = totals["queries"] / elapsed if elapsed else 0
+        print(
+            f"{totals['queries']} queries in {elapsed:.2f}s ({rate:.0f}/s): "
+            f"{totals['with errors']} with errors, "
+            f"{totals['unsupported']} unsupported, {totals['failed']} failed, "
+            f"{parsing.stats.fallbacks} LL fallbacks",
+            file=sys.stderr,
+        )
+        if cache is not None:
+            print(f"  {totals['cached']} results from the cache", file=sys.stderr)
+        for pid, (count, seconds) in sorted(workers.items()):
+            rate = count / seconds if seconds else 0
+            print(
+                f"  worker {pid}: {count} queries in {seconds:.2f}s ({rate:.0f}/s)",
+                file=sys.stderr,
+            )
+
+    failures = totals["with errors"] + totals["unsupported"] + totals["failed"]
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="file, directory or glob to lint, or - for queries on stdin",
+    )
+    parser.add_argument(
+        "-0",
+        "--null",
+        action="store_true",
+        help="queries on stdin are separated by NUL instead of newline",
+    )
+    parser.add_argument(
+        "--dfa-cache",
+        nargs="?",
+        const="",
+        default=os.environ.get(snapshot.DFA_CACHE_ENV),
+        metavar="PATH",
+        help="load the parser's DFA from PATH and save it back at exit",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="lint in N worker processes (0 for one per CPU)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=32,
+        metavar="N",
+        help="inputs sent to a worker at a time with --jobs",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="with --jobs, report results as chunks finish, not in input order",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="lint everything again instead of reusing cached results",
+    )
+    parser.add_argument("--format", choices=list(RENDERERS), default="text")
+    parser.add_argument(
+        "--summary", action="store_true", help="print totals and throughput"
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="summary",
+        choices=("summary", "json"),
+        help="report time per phase and counters at exit",
+    )
+
+    args = parser.parse_args()
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+
+    if args.dfa_cache is not None:
+        snapshot.enableDFACache(args.dfa_cache or None)
+    if args.stats:
+        main.enableStats(args.stats)
+
+    sys.exit(run(args))
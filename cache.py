@@ -0,0 +1,156 @@
+import glob
+import hashlib
+import json
+import os
+import time
+
+import snapshot
+from main import RULES, VERSION
+
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# evict() only walks the whole cache this often, or when the size estimated
+# from a few of the 256 key prefix directories is over budget
+EVICT_INTERVAL = 24 * 60 * 60
+EVICT_SAMPLE = ("00", "55", "aa", "ff")
+SWEEP_MARKER = ".swept"
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_source_digest = None
+
+
+def sourceDigest() -> str:
+    """sha256 of the checker's sources and the antlr4 runtime version.
+
+    Part of every cache key, so that results are never replayed from a
+    different version of the code, whether or not VERSION was bumped.
+    """
+    global _source_digest
+    if _source_digest is None:
+        digest = hashlib.sha256(snapshot.runtimeVersion().encode())
+        paths = glob.glob(os.path.join(ROOT, "*.py"))
+        paths += glob.glob(os.path.join(ROOT, "gen", "*.py"))
+        for path in sorted(paths):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        _source_digest = digest.hexdigest()
+    return _source_digest
+
+
+class ResultCache:
+    """Lint results on disk, keyed by the linted text and the checker.
+
+    Each entry is a small JSON file named after the sha256 of the text,
+    VERSION, RULES and sourceDigest(), so a result is reused only for
+    identical input checked by the same code. Reading an entry refreshes its
+    mtime, and evict() removes entries older than `max_age` seconds and then
+    the least recently used ones until the cache fits in `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str = None,
+        max_bytes: int = CACHE_MAX_BYTES,
+        max_age: float = CACHE_MAX_AGE,
+    ):
+        self.directory = directory or os.path.join(snapshot.cacheDir(), "results")
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{VERSION}\0{','.join(RULES)}\0{sourceDigest()}\0".encode())
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str):
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict):
+        path = self.path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except OSError:
+            # A cache that can't be written only costs speed
+            pass
+
+    def estimateSize(self) -> int:
+        """Total size of the entries, extrapolated from the EVICT_SAMPLE
+        directories. Keys are uniform hashes, so each prefix holds about the
+        same share."""
+        size = 0
+        for prefix in EVICT_SAMPLE:
+            try:
+                with os.scandir(os.path.join(self.directory, prefix)) as it:
+                    size += sum(entry.stat().st_size for entry in it)
+            except OSError:
+                pass
+        return size * 256 // len(EVICT_SAMPLE)
+
+    def evict(self):
+        """Sweep the cache if it is due or looks too big, otherwise return
+        after listing a few directories."""
+        marker = os.path.join(self.directory, SWEEP_MARKER)
+        now = time.time()
+        try:
+            due = now - os.stat(marker).st_mtime > EVICT_INTERVAL
+        except OSError:
+            due = True
+        if not due and self.estimateSize() <= self.max_bytes:
+            return
+        self.sweep()
+        try:
+            with open(marker, "w"):
+                pass
+        except OSError:
+            pass
+
+    def sweep(self):
+        entries = []
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name == SWEEP_MARKER:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    self._remove(path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -0,0 +1,161 @@
+import re
+import threading
+
+from collections import OrderedDict
+
+from antlr4.atn.ATNState import RuleStopState
+from antlr4.atn.Transition import RuleTransition
+
+import batch
+import parsing
+from diagnostics import Diagnostic
+from gen.CypherLexer import CypherLexer
+
+EXACT_CACHE_SIZE = 1024
+FINGERPRINT_CACHE_SIZE = 4096
+
+
+def whitespaceChars() -> str:
+    """The characters the lexer's WHITESPACE rule matches.
+
+    Read from the lexer's ATN rather than written out, so this stays in step
+    with the grammar. Comments, the rule's other alternative, are left out.
+    """
+    names = CypherLexer.ruleNames
+    atn = CypherLexer.atn
+    chars = set()
+    seen = set()
+    stack = [atn.ruleToStartState[names.index("WHITESPACE")]]
+    while stack:
+        state = stack.pop()
+        # Rule stop states lead back to every caller of the rule
+        if state.stateNumber in seen or isinstance(state, RuleStopState):
+            continue
+        seen.add(state.stateNumber)
+        for t in state.transitions:
+            if isinstance(t, RuleTransition):
+                if names[t.target.ruleIndex] != "Comment":
+                    stack.append(t.target)
+                stack.append(t.followState)
+                continue
+            if t.label is not None:
+                for interval in t.label.intervals:
+                    chars.update(interval)
+            stack.append(t.target)
+    return "".join(chr(c) for c in sorted(chars) if c >= 0)
+
+
+# Strings and escaped names are kept as they are, comments and whitespace
+# runs outside them become one space. Only Cypher's whitespace counts, which
+# is not the same as \s.
+_FINGERPRINT_RE = re.compile(
+    r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)"""
+    rf"""|(?:[{re.escape(whitespaceChars())}]|//[^\n]*|/\*.*?\*/)+""",
+    re.DOTALL,
+)
+
+
+def fingerprint(query: str) -> str:
+    """`query` with comments and whitespace normalized.
+
+    Queries with the same fingerprint differ only in SP tokens, which the
+    checker ignores, so they get the same findings at different positions.
+    """
+    return _FINGERPRINT_RE.sub(lambda m: m.group(1) or " ", query).strip(" ")
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def _copy(result: batch.Result) -> batch.Result:
+    diagnostics = [
+        Diagnostic(d.rule, d.message, d.line, d.column, d.span)
+        for d in result.diagnostics
+    ]
+    return batch.Result(
+        result.name,
+        diagnostics,
+        result.message,
+        result.unsupported,
+        result.failed,
+        result.cached,
+    )
+
+
+class Checker:
+    """Lints query strings, remembering results for repeated queries.
+
+    The first tier maps exact query strings to their result. The second maps
+    fingerprints to results without findings: a query that only differs from
+    a clean one in whitespace or comments is clean too, but findings would
+    point at the wrong positions, so those are only reused for exact matches.
+
+    Every call returns its own copy of the result, so callers can move the
+    diagnostics around (as Statement.locate does) without changing what
+    other callers get.
+    """
+
+    def __init__(
+        self,
+        exact_size: int = EXACT_CACHE_SIZE,
+        fingerprint_size: int = FINGERPRINT_CACHE_SIZE,
+    ):
+        self.exact = LRUCache(exact_size)
+        self.fingerprints = LRUCache(fingerprint_size)
+        # Guards the caches. Linting also takes parsing.session_lock, since
+        # every Checker (and anything else) shares the process' session
+        self.lock = threading.Lock()
+
+    def check(self, query: str) -> batch.Result:
+        with self.lock:
+            if (result := self.exact.get(query)) is not None:
+                return _copy(result)
+            key = fingerprint(query)
+            if (result := self.fingerprints.get(key)) is None:
+                with parsing.session_lock:
+                    result = batch.lintOne("<query>", query)
+                if result.ok:
+                    self.fingerprints.put(key, result)
+            self.exact.put(query, result)
+            return _copy(result)
+
+
+_checker = None
+
+
+def getChecker() -> Checker:
+    global _checker
+    if _checker is None:
+        _checker = Checker()
+    return _checker
+
+
+def check(query: str) -> batch.Result:
+    return getChecker().check(query)
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""A main.py replacement that hands the query to a running daemon.py.
+
+Only the standard library, diagnostics.py and splitter.py are imported, so
+starting the client costs little more than a bare Python startup. As with
+main.py, --file is split into its ';'-separated statements, and each one is
+sent on its own. If no daemon is listening the queries are linted in process
+instead, which is as slow as running main.py.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+
+from diagnostics import RENDERERS, Diagnostic
+from splitter import Statement, splitFile
+
+SOCKET_ENV = "CYPHERCHECK_SOCKET"
+
+
+def socketPath() -> str:
+    # Same directory as snapshot.cacheDir(), which can't be imported here
+    # without pulling in antlr4
+    if path := os.environ.get(SOCKET_ENV):
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "cyphercheck", "daemon.sock")
+
+
+def request(path: str, message: dict) -> dict:
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(path)
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps(message).encode() + b"\n")
+            f.flush()
+            line = f.readline()
+    return json.loads(line) if line else None
+
+
+def lintInProcess(name: str, text: str, use_cache: bool) -> dict:
+    import batch
+    from cache import ResultCache
+
+    result = batch.lintCached(name, text, ResultCache() if use_cache else None)
+    return result.toDict()
+
+
+def lint(name: str, text: str, path: str, use_cache: bool = True) -> dict:
+    try:
+        return request(path, {"name": name, "text": text, "cache": use_cache})
+    except (FileNotFoundError, ConnectionRefusedError):
+        return lintInProcess(name, text, use_cache)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--query", action="store")
+    parser.add_argument("--file", action="store")
+    parser.add_argument("--socket", default=socketPath(), metavar="PATH")
+    parser.add_argument("--format", choices=list(RENDERERS), default="text")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't reuse or store results in the on-disk cache",
+    )
+    parser.add_argument(
+        "--stop", action="store_true", help="shut down the running daemon"
+    )
+    args = parser.parse_args()
+
+    if args.stop:
+        request(args.socket, {"stop": True})
+        sys.exit(0)
+
+    assert args.query or args.file, "One of --query and --file is required!"
+
+    if args.query:
+        name = "<query>"
+        statements = [Statement(args.query, 0, 0, 0)]
+    else:
+        name = args.file
+        statements = splitFile(args.file)
+    # As in main.py, the text output doesn't name the file
+    shown = None if args.query or args.format == "text" else args.file
+
+    out = sys.stderr if args.format == "text" else sys.stdout
+    renderer = RENDERERS[args.format](out)
+    status = 0
+    for statement in statements:
+        response = lint(name, statement.text, args.socket, not args.no_cache)
+        diagnostics = [Diagnostic.fromDict(d) for d in response["diagnostics"]]
+        lines = statement.lines()
+        statement.locate(diagnostics, lines)
+        renderer.add(shown, lines, diagnostics, response["message"])
+        if diagnostics or response["unsupported"] or response["failed"]:
+            status = 1
+    renderer.close()
+    sys.exit(status)
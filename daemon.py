@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""Keep a warm checker running behind a Unix socket for client.py.
+
+The protocol is one JSON object per line in each direction. A request is
+{"name": ..., "text": ..., "cache": bool} and is answered with
+batch.Result.toDict(): the findings as diagnostics.Diagnostic.toDict()
+records and anything else reported for the query. {"stop": true} shuts the
+daemon down.
+"""
+import argparse
+import json
+import os
+import socket
+import signal
+import socketserver
+import sys
+import threading
+
+import batch
+import snapshot
+from cache import ResultCache
+from client import SOCKET_ENV, socketPath
+
+
+class LintHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get("stop"):
+                # shutdown() waits for serve_forever, which is running this
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            cache = self.server.cache if request.get("cache", True) else None
+            result = batch.lintCached(
+                request.get("name", "<query>"), request["text"], cache
+            )
+            self.wfile.write(json.dumps(result.toDict()).encode() + b"\n")
+            self.wfile.flush()
+
+
+def removeStaleSocket(path: str):
+    """Remove `path` if nothing is listening on it, fail if something is."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+    sys.exit(f"A daemon is already listening on {path}")
+
+
+def serve(path: str, cache: ResultCache = None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    removeStaleSocket(path)
+    # Build the parser before accepting connections so the first client
+    # doesn't pay for it
+    batch.lintOne("<warmup>", "RETURN 1")
+    # Requests are handled one at a time: the shared ParserSession is not
+    # thread-safe, and a single lint is only a few milliseconds
+    with socketserver.UnixStreamServer(path, LintHandler) as server:
+        server.cache = cache
+        os.chmod(path, 0o600)
+        # Exit cleanly on SIGTERM too, so the socket is removed and the DFA
+        # cache is saved
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever(poll_interval=0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+            if cache is not None:
+                cache.evict()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--socket",
+        default=socketPath(),
+        metavar="PATH",
+        help=f"socket to listen on (default: ${SOCKET_ENV} or the cache dir)",
+    )
+    parser.add_argument(
+        "--dfa-cache",
+        nargs="?",
+        const="",
+        default=os.environ.get(snapshot.DFA_CACHE_ENV),
+        metavar="PATH",
+        help="load the parser's DFA from PATH and save it back at exit",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't reuse or store results in the on-disk cache",
+    )
+    args = parser.parse_args()
+
+    if args.dfa_cache is not None:
+        snapshot.enableDFACache(args.dfa_cache or None)
+
+    serve(args.socket, None if args.no_cache else ResultCache())
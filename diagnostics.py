@@ -0,0 +1,203 @@
+"""Lint findings and the renderers that print them.
+
+Only the standard library is used here, so client.py can render what the
+daemon sends back without importing the parser.
+"""
+import json
+
+from positions import LineIndex
+
+TOOL_NAME = "cyphercheck"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class Diagnostic:
+    """One finding. `line` is 1-based and `column` 0-based, like ANTLR
+    tokens, and `span` is the (start, end) character range, end exclusive."""
+
+    __slots__ = ("rule", "message", "line", "column", "span")
+
+    def __init__(self, rule: str, message: str, line: int, column: int, span):
+        self.rule = rule
+        self.message = message
+        self.line = line
+        self.column = column
+        self.span = tuple(span)
+
+    def __eq__(self, other):
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+        return self.toDict() == other.toDict()
+
+    def __repr__(self):
+        return (
+            f"Diagnostic({self.rule!r}, {self.message!r}, "
+            f"{self.line}, {self.column}, {self.span})"
+        )
+
+    def toDict(self) -> dict:
+        return {
+            "rule": self.rule,
+            "message": self.message,
+            "line": self.line,
+            "column": self.column,
+            "span": list(self.span),
+        }
+
+    @classmethod
+    def fromDict(cls, value: dict) -> "Diagnostic":
+        return cls(**value)
+
+
+class Renderer:
+    """Collects the findings for each linted input and writes them to `out`.
+
+    Output is buffered and written every `flush_every` inputs and on flush
+    or close, rather than with a write per line.
+    """
+
+    flush_every = 256
+
+    def __init__(self, out):
+        self.out = out
+        self.buffer = []
+        self.pending = 0
+
+    def add(self, name, lines: LineIndex, diagnostics, message: str = ""):
+        """Add the result for one input. `name` is None when linting a
+        single query, `lines` indexes the linted text and `message` is
+        anything else to report for it, such as why it could not be
+        checked."""
+        self.render(name, lines, diagnostics, message)
+        self.pending += 1
+        if self.pending >= self.flush_every:
+            self.flush()
+
+    def render(self, name, lines: LineIndex, diagnostics, message: str):
+        raise NotImplementedError
+
+    def flush(self):
+        if self.buffer:
+            self.out.write("".join(self.buffer))
+            self.out.flush()
+            self.buffer.clear()
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+
+
+class TextRenderer(Renderer):
+    """The caret-annotated output main.py has always printed."""
+
+    def render(self, name, lines, diagnostics, message):
+        if not (diagnostics or message):
+            return
+        buffer = self.buffer
+        if name is not None:
+            buffer.append(f"{name}:\n")
+        buffer.append(message)
+        for d in diagnostics:
+            if d.rule == "SyntaxError":
+                # Unlike other rules, the name alone doesn't say what's wrong
+                buffer.append(
+                    f"{d.rule} on line: {d.line}, col: {d.column}: {d.message}\n"
+                )
+            else:
+                buffer.append(f"{d.rule} on line: {d.line}, col: {d.column}\n")
+            # The line is printed without its indentation, and for a statement
+            # that starts mid-line only its own part of the line is there, so
+            # the caret moves back by both
+            text = lines.lineText(d.line)
+            column = d.column - lines.lineColumn(d.line)
+            column -= len(text) - len(text.lstrip())
+            buffer.append(f"{text.strip()}\n")
+            buffer.append(f"{' ' * column}^\n")
+
+
+class JSONLinesRenderer(Renderer):
+    """One JSON object per finding, plus one per input that failed."""
+
+    def render(self, name, lines, diagnostics, message):
+        for d in diagnostics:
+            record = d.toDict()
+            record["name"] = name
+            self.buffer.append(json.dumps(record) + "\n")
+        if message:
+            record = {"name": name, "rule": None, "message": message.strip()}
+            self.buffer.append(json.dumps(record) + "\n")
+
+
+class SarifRenderer(Renderer):
+    """A single SARIF 2.1.0 log, written when the renderer is closed."""
+
+    def __init__(self, out):
+        super().__init__(out)
+        self.results = []
+        self.rules = {}
+        self.notifications = []
+
+    def render(self, name, lines, diagnostics, message):
+        location = {"artifactLocation": {"uri": name or "<query>"}}
+        for d in diagnostics:
+            self.rules.setdefault(d.rule, {"id": d.rule})
+            region = {
+                "startLine": d.line,
+                "startColumn": d.column + 1,
+                "charOffset": d.span[0],
+                "charLength": d.span[1] - d.span[0],
+            }
+            self.results.append(
+                {
+                    "ruleId": d.rule,
+                    "level": "error",
+                    "message": {"text": d.message},
+                    "locations": [
+                        {"physicalLocation": dict(location, region=region)}
+                    ],
+                }
+            )
+        if message:
+            self.notifications.append(
+                {
+                    "level": "warning",
+                    "message": {"text": message.strip()},
+                    "locations": [{"physicalLocation": location}],
+                }
+            )
+
+    def flush(self):
+        # Nothing can be written until the whole log is known
+        self.pending = 0
+
+    def close(self):
+        log = {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": TOOL_NAME,
+                            "rules": list(self.rules.values()),
+                        }
+                    },
+                    "invocations": [
+                        {
+                            "executionSuccessful": True,
+                            "toolExecutionNotifications": self.notifications,
+                        }
+                    ],
+                    "results": self.results,
+                }
+            ],
+        }
+        self.out.write(json.dumps(log, indent=2) + "\n")
+        self.out.flush()
+
+
+RENDERERS = {
+    "text": TextRenderer,
+    "json": JSONLinesRenderer,
+    "sarif": SarifRenderer,
+}
@@ -0,0 +1,224 @@
+from array import array
+
+from antlr4 import ParserRuleContext
+from antlr4.tree.Tree import ParseTreeListener
+
+from gen.CypherParser import CypherParser
+
+_COLUMNS = ("rule", "parent", "firstChild", "nextSibling", "startToken", "stopToken", "end")
+_TOKEN_COLUMNS = ("tokenType", "tokenStart", "tokenStop", "tokenLine", "tokenColumn")
+
+
+class FlatTree:
+    """A parse tree stored as parallel integer columns.
+
+    Node i is the i-th node in document order. `rule` is its rule index, or
+    -1 for terminals. `parent`, `firstChild` and `nextSibling` are node
+    numbers (-1 if missing), `startToken`/`stopToken` are token indexes and
+    `end` is one past the last node of its subtree, so the subtree of i is
+    the range [i, end[i]). Token columns are indexed by token index and give
+    character offsets into `source`.
+
+    No per-node Python objects are kept, so trees are cheap to hold in bulk
+    and can be passed between processes with toBytes/fromBytes.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        for column in _COLUMNS + _TOKEN_COLUMNS:
+            setattr(self, column, array("i"))
+
+    def __len__(self):
+        return len(self.rule)
+
+    def addToken(self, token):
+        self.tokenType.append(token.type)
+        self.tokenStart.append(token.start)
+        self.tokenStop.append(token.stop)
+        self.tokenLine.append(token.line)
+        self.tokenColumn.append(token.column)
+
+    def text(self, i: int) -> str:
+        start, stop = self.startToken[i], self.stopToken[i]
+        if stop < start:
+            return ""
+        return self.source[self.tokenStart[start]:self.tokenStop[stop] + 1]
+
+    def position(self, i: int):
+        token = self.startToken[i]
+        return self.tokenLine[token], self.tokenColumn[token]
+
+    def children(self, i: int):
+        child = self.firstChild[i]
+        while child != -1:
+            yield child
+            child = self.nextSibling[child]
+
+    def child(self, i: int, rule: int) -> int:
+        for child in self.children(i):
+            if self.rule[child] == rule:
+                return child
+        return -1
+
+    def hasRule(self, i: int, rules) -> bool:
+        subtree = self.rule[i:self.end[i]]
+        return any(rule in subtree for rule in rules)
+
+    def getRule(self, i: int, rules):
+        """Nodes in the subtree of i with a rule in `rules`, not nested in
+        another match (like visitor.getType)."""
+        found = []
+        j, end = i, self.end[i]
+        rule = self.rule
+        while j < end:
+            if rule[j] in rules:
+                found.append(j)
+                j = self.end[j]
+            else:
+                j += 1
+        return found
+
+    def toBytes(self) -> bytes:
+        columns = _COLUMNS + _TOKEN_COLUMNS
+        header = array("i", [len(self.rule), len(self.tokenType)]).tobytes()
+        body = b"".join(getattr(self, column).tobytes() for column in columns)
+        return header + body + self.source.encode("utf-8")
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> "FlatTree":
+        header = array("i")
+        header.frombytes(data[:2 * header.itemsize])
+        nodes, tokens = header
+        offset = 2 * header.itemsize
+
+        columns = []
+        for column in _COLUMNS:
+            columns.append((column, nodes))
+        for column in _TOKEN_COLUMNS:
+            columns.append((column, tokens))
+
+        values = {}
+        for column, count in columns:
+            values[column] = array("i")
+            size = count * values[column].itemsize
+            values[column].frombytes(data[offset:offset + size])
+            offset += size
+
+        tree = cls(data[offset:].decode("utf-8"))
+        for column, value in values.items():
+            setattr(tree, column, value)
+        return tree
+
+
+class FlatTreeBuilder(ParseTreeListener):
+    """Fills a FlatTree from parser events as the parse runs.
+
+    Add it with CypherParser.addParseListener, ideally with buildParseTrees
+    off. Token columns are filled afterwards from the token stream by
+    addTokens.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.reset()
+
+    def reset(self):
+        self.tree = FlatTree(self.source)
+        self._open = []
+        self._lastChild = []
+
+    def _add(self, rule, start, stop):
+        tree = self.tree
+        i = len(tree.rule)
+        parent = self._open[-1] if self._open else -1
+        tree.rule.append(rule)
+        tree.parent.append(parent)
+        tree.firstChild.append(-1)
+        tree.nextSibling.append(-1)
+        tree.startToken.append(start)
+        tree.stopToken.append(stop)
+        tree.end.append(i + 1)
+        self._lastChild.append(-1)
+        if parent != -1:
+            last = self._lastChild[parent]
+            if last == -1:
+                tree.firstChild[parent] = i
+            else:
+                tree.nextSibling[last] = i
+            self._lastChild[parent] = i
+        return i
+
+    def enterEveryRule(self, ctx: ParserRuleContext):
+        self._open.append(self._add(ctx.getRuleIndex(), ctx.start.tokenIndex, -1))
+
+    def exitEveryRule(self, ctx: ParserRuleContext):
+        i = self._open.pop()
+        stop = ctx.stop
+        self.tree.stopToken[i] = stop.tokenIndex if stop is not None else -1
+        self.tree.end[i] = len(self.tree.rule)
+
+    def visitTerminal(self, node):
+        index = node.symbol.tokenIndex
+        self._add(-1, index, index)
+
+    def visitErrorNode(self, node):
+        self.visitTerminal(node)
+
+    def addTokens(self, tokens):
+        tree = self.tree
+        for token in tokens:
+            # Leave tokens that aren't in the tree (e.g. before a subtree
+            # root) as -1 so token columns stay indexed by tokenIndex
+            while len(tree.tokenType) < token.tokenIndex:
+                for column in _TOKEN_COLUMNS:
+                    getattr(tree, column).append(-1)
+            tree.addToken(token)
+
+
+def toFlat(root) -> FlatTree:
+    """Build a FlatTree from an already parsed ANTLR tree."""
+    builder = FlatTreeBuilder(root.start.getInputStream().strdata)
+    tokens = {}
+    stack = [(root, False)]
+    while stack:
+        node, done = stack.pop()
+        if done:
+            builder.exitEveryRule(node)
+        elif isinstance(node, ParserRuleContext):
+            builder.enterEveryRule(node)
+            tokens[node.start.tokenIndex] = node.start
+            stack.append((node, True))
+            if node.children:
+                stack.extend((child, False) for child in reversed(node.children))
+        else:
+            builder.visitTerminal(node)
+            tokens[node.symbol.tokenIndex] = node.symbol
+
+    # Every consumed token is a terminal somewhere in the tree
+    builder.addTokens(tokens[index] for index in sorted(tokens))
+    return builder.tree
+
+
+DEFINING_RULES = frozenset((
+    CypherParser.RULE_oC_ProjectionItem,
+    CypherParser.RULE_oC_Unwind,
+    CypherParser.RULE_oC_YieldItem,
+    CypherParser.RULE_oC_NodePattern,
+    CypherParser.RULE_oC_RelationshipDetail,
+))
+
+
+def definedVariables(tree: FlatTree, i: int):
+    """Nodes naming the variables defined in the subtree of i.
+
+    The FlatTree counterpart of main.extractDefinedVariables.
+    """
+    variables = []
+    for clause in tree.getRule(i, DEFINING_RULES):
+        variable = tree.child(clause, CypherParser.RULE_oC_Variable)
+        if variable == -1 and tree.rule[clause] == CypherParser.RULE_oC_ProjectionItem:
+            # An un-aliased projection is named after its expression
+            variable = tree.child(clause, CypherParser.RULE_oC_Expression)
+        if variable != -1:
+            variables.append(variable)
+    return variables
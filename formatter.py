@@ -6,7 +6,7 @@ from typing import Dict, List, Tuple
 from antlr4 import *
 
 from gen.CypherLexer import CypherLexer
-erom gen.CypherParser import CypherParser
+from gen.CypherParser import CypherParser
 
 from visitor import *
 
@@ -83,7 +83,7 @@ class Formatter:
             self.indent = self.indent[:-len(INDENT_STR)]
 
     def format_OC_VariableContext(self, ctx):
-        self.add_or_indent_add(ctx.getText())
+        self.add_or_indent_add(spanText(ctx))
 
     def format_OC_LiteralContext(self, ctx):
         if isinstance(ctx, CypherParser.OC_MapLiteralContext):
@@ -91,10 +91,10 @@ class Formatter:
         elif isinstance(ctx, CypherParser.OC_ListLiteralContext):
             pass
         else:
-            self.add_or_indent_add(ctx.getText())
+            self.add_or_indent_add(spanText(ctx))
 
     def format_OC_FunctionInvocationContext(self, ctx, indent: str):
-        start_call = ctx.oC_FunctionName().getText() + '('
+        start_call = spanText(ctx.oC_FunctionName()) + '('
 
         is_distinct = False
         def find_distinct(ctx):
@@ -134,9 +134,9 @@ class Formatter:
         self.add_or_indent_add(")")
 
     def format_OC_UnaryAddOrSubtractExpressionContext(self, ctx):
-        if len(ctx.children) > 1
+        if len(ctx.children) > 1:
             self.save()
-            sign = ctx.children[1].getText()
+            sign = spanText(ctx.children[1])
             self.add_ignoring_limit(f" {sign}")
             if self.last_line_length() >= MAX_LINE_LENGTH:
                 self.restore()
@@ -170,7 +170,7 @@ class Formatter:
         bin_exp_list = []
         bin_exp_list.append(ctx.oC_AddOrSubtractExpression())
         for child in bin_exp_list.children[1:]:
-            if child.getText().isspace():
+            if spanText(child).isspace():
                 continue
             bin_exp_list.append(child.children)
         self.format_OC_BinExpressionContext(
@@ -212,11 +212,11 @@ class Formatter:
         formatter(lhs)
         i = 1
         while i < len(parts):
-            while parts[i].getText().isspace():
+            while spanText(parts[i]).isspace():
                 i += 1
-            op = parts[i].getText().upper()
+            op = spanText(parts[i]).upper()
             i += 1
-            while parts[i].getText().isspace():
+            while spanText(parts[i]).isspace():
                 i += 1
             operand = parts[i]
             self.save()
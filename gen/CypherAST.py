@@ -0,0 +1,1263 @@
+# Generated by create_cypher_ast.py from CypherParser, do not edit.
+
+
+class Node:
+    """A parse tree node without the parser bookkeeping of ParserRuleContext.
+
+    `start` and `stop` are character offsets into `source`, inclusive.
+    """
+
+    __slots__ = ("parentCtx", "children", "start", "stop", "line", "column", "source")
+    ruleIndex = -1
+
+    def __init__(self, parentCtx, start, stop, line, column, source):
+        self.parentCtx = parentCtx
+        self.children = ()
+        self.start = start
+        self.stop = stop
+        self.line = line
+        self.column = column
+        self.source = source
+
+    def getRuleIndex(self):
+        return self.ruleIndex
+
+    def getText(self):
+        return self.source[self.start:self.stop + 1]
+
+    def getChild(self, ctxType, i):
+        for child in self.children:
+            if isinstance(child, ctxType):
+                if i == 0:
+                    return child
+                i -= 1
+        return None
+
+    def getChildren(self, ctxType):
+        return [child for child in self.children if isinstance(child, ctxType)]
+
+
+class Terminal:
+    __slots__ = ("parentCtx", "type", "start", "stop", "line", "column", "source")
+
+    def __init__(self, parentCtx, type, start, stop, line, column, source):
+        self.parentCtx = parentCtx
+        self.type = type
+        self.start = start
+        self.stop = stop
+        self.line = line
+        self.column = column
+        self.source = source
+
+    def getText(self):
+        return self.source[self.start:self.stop + 1]
+
+
+class OC_CypherContext(Node):
+    __slots__ = ()
+    ruleIndex = 0
+
+    def oC_Statement(self):
+        return self.getChild(OC_StatementContext, 0)
+
+
+class OC_StatementContext(Node):
+    __slots__ = ()
+    ruleIndex = 1
+
+    def oC_Query(self):
+        return self.getChild(OC_QueryContext, 0)
+
+
+class OC_QueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 2
+
+    def oC_RegularQuery(self):
+        return self.getChild(OC_RegularQueryContext, 0)
+
+    def oC_StandaloneCall(self):
+        return self.getChild(OC_StandaloneCallContext, 0)
+
+
+class OC_RegularQueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 3
+
+    def oC_SingleQuery(self):
+        return self.getChild(OC_SingleQueryContext, 0)
+
+    def oC_Union(self, i=None):
+        if i is None:
+            return self.getChildren(OC_UnionContext)
+        return self.getChild(OC_UnionContext, i)
+
+
+class OC_UnionContext(Node):
+    __slots__ = ()
+    ruleIndex = 4
+
+    def oC_SingleQuery(self):
+        return self.getChild(OC_SingleQueryContext, 0)
+
+
+class OC_SingleQueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 5
+
+    def oC_MultiPartQuery(self):
+        return self.getChild(OC_MultiPartQueryContext, 0)
+
+    def oC_SinglePartQuery(self):
+        return self.getChild(OC_SinglePartQueryContext, 0)
+
+
+class OC_SinglePartQueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 6
+
+    def oC_ReadingClause(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ReadingClauseContext)
+        return self.getChild(OC_ReadingClauseContext, i)
+
+    def oC_Return(self):
+        return self.getChild(OC_ReturnContext, 0)
+
+    def oC_UpdatingClause(self, i=None):
+        if i is None:
+            return self.getChildren(OC_UpdatingClauseContext)
+        return self.getChild(OC_UpdatingClauseContext, i)
+
+
+class OC_MultiPartQueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 7
+
+    def oC_ReadingClause(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ReadingClauseContext)
+        return self.getChild(OC_ReadingClauseContext, i)
+
+    def oC_SinglePartQuery(self):
+        return self.getChild(OC_SinglePartQueryContext, 0)
+
+    def oC_UpdatingClause(self, i=None):
+        if i is None:
+            return self.getChildren(OC_UpdatingClauseContext)
+        return self.getChild(OC_UpdatingClauseContext, i)
+
+    def oC_With(self, i=None):
+        if i is None:
+            return self.getChildren(OC_WithContext)
+        return self.getChild(OC_WithContext, i)
+
+
+class OC_UpdatingClauseContext(Node):
+    __slots__ = ()
+    ruleIndex = 8
+
+    def oC_Create(self):
+        return self.getChild(OC_CreateContext, 0)
+
+    def oC_Delete(self):
+        return self.getChild(OC_DeleteContext, 0)
+
+    def oC_Merge(self):
+        return self.getChild(OC_MergeContext, 0)
+
+    def oC_Remove(self):
+        return self.getChild(OC_RemoveContext, 0)
+
+    def oC_Set(self):
+        return self.getChild(OC_SetContext, 0)
+
+
+class OC_ReadingClauseContext(Node):
+    __slots__ = ()
+    ruleIndex = 9
+
+    def oC_InQueryCall(self):
+        return self.getChild(OC_InQueryCallContext, 0)
+
+    def oC_Match(self):
+        return self.getChild(OC_MatchContext, 0)
+
+    def oC_Unwind(self):
+        return self.getChild(OC_UnwindContext, 0)
+
+
+class OC_MatchContext(Node):
+    __slots__ = ()
+    ruleIndex = 10
+
+    def oC_Pattern(self):
+        return self.getChild(OC_PatternContext, 0)
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+
+class OC_UnwindContext(Node):
+    __slots__ = ()
+    ruleIndex = 11
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_MergeContext(Node):
+    __slots__ = ()
+    ruleIndex = 12
+
+    def oC_MergeAction(self, i=None):
+        if i is None:
+            return self.getChildren(OC_MergeActionContext)
+        return self.getChild(OC_MergeActionContext, i)
+
+    def oC_PatternPart(self):
+        return self.getChild(OC_PatternPartContext, 0)
+
+
+class OC_MergeActionContext(Node):
+    __slots__ = ()
+    ruleIndex = 13
+
+    def oC_Set(self):
+        return self.getChild(OC_SetContext, 0)
+
+
+class OC_CreateContext(Node):
+    __slots__ = ()
+    ruleIndex = 14
+
+    def oC_Pattern(self):
+        return self.getChild(OC_PatternContext, 0)
+
+
+class OC_SetContext(Node):
+    __slots__ = ()
+    ruleIndex = 15
+
+    def oC_SetItem(self, i=None):
+        if i is None:
+            return self.getChildren(OC_SetItemContext)
+        return self.getChild(OC_SetItemContext, i)
+
+
+class OC_SetItemContext(Node):
+    __slots__ = ()
+    ruleIndex = 16
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_NodeLabels(self):
+        return self.getChild(OC_NodeLabelsContext, 0)
+
+    def oC_PropertyExpression(self):
+        return self.getChild(OC_PropertyExpressionContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_DeleteContext(Node):
+    __slots__ = ()
+    ruleIndex = 17
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+
+class OC_RemoveContext(Node):
+    __slots__ = ()
+    ruleIndex = 18
+
+    def oC_RemoveItem(self, i=None):
+        if i is None:
+            return self.getChildren(OC_RemoveItemContext)
+        return self.getChild(OC_RemoveItemContext, i)
+
+
+class OC_RemoveItemContext(Node):
+    __slots__ = ()
+    ruleIndex = 19
+
+    def oC_NodeLabels(self):
+        return self.getChild(OC_NodeLabelsContext, 0)
+
+    def oC_PropertyExpression(self):
+        return self.getChild(OC_PropertyExpressionContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_InQueryCallContext(Node):
+    __slots__ = ()
+    ruleIndex = 20
+
+    def oC_ExplicitProcedureInvocation(self):
+        return self.getChild(OC_ExplicitProcedureInvocationContext, 0)
+
+    def oC_YieldItems(self):
+        return self.getChild(OC_YieldItemsContext, 0)
+
+
+class OC_StandaloneCallContext(Node):
+    __slots__ = ()
+    ruleIndex = 21
+
+    def oC_ExplicitProcedureInvocation(self):
+        return self.getChild(OC_ExplicitProcedureInvocationContext, 0)
+
+    def oC_ImplicitProcedureInvocation(self):
+        return self.getChild(OC_ImplicitProcedureInvocationContext, 0)
+
+    def oC_YieldItems(self):
+        return self.getChild(OC_YieldItemsContext, 0)
+
+
+class OC_YieldItemsContext(Node):
+    __slots__ = ()
+    ruleIndex = 22
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+    def oC_YieldItem(self, i=None):
+        if i is None:
+            return self.getChildren(OC_YieldItemContext)
+        return self.getChild(OC_YieldItemContext, i)
+
+
+class OC_YieldItemContext(Node):
+    __slots__ = ()
+    ruleIndex = 23
+
+    def oC_ProcedureResultField(self):
+        return self.getChild(OC_ProcedureResultFieldContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_WithContext(Node):
+    __slots__ = ()
+    ruleIndex = 24
+
+    def oC_ProjectionBody(self):
+        return self.getChild(OC_ProjectionBodyContext, 0)
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+
+class OC_ReturnContext(Node):
+    __slots__ = ()
+    ruleIndex = 25
+
+    def oC_ProjectionBody(self):
+        return self.getChild(OC_ProjectionBodyContext, 0)
+
+
+class OC_ProjectionBodyContext(Node):
+    __slots__ = ()
+    ruleIndex = 26
+
+    def oC_Limit(self):
+        return self.getChild(OC_LimitContext, 0)
+
+    def oC_Order(self):
+        return self.getChild(OC_OrderContext, 0)
+
+    def oC_ProjectionItems(self):
+        return self.getChild(OC_ProjectionItemsContext, 0)
+
+    def oC_Skip(self):
+        return self.getChild(OC_SkipContext, 0)
+
+
+class OC_ProjectionItemsContext(Node):
+    __slots__ = ()
+    ruleIndex = 27
+
+    def oC_ProjectionItem(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ProjectionItemContext)
+        return self.getChild(OC_ProjectionItemContext, i)
+
+
+class OC_ProjectionItemContext(Node):
+    __slots__ = ()
+    ruleIndex = 28
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_OrderContext(Node):
+    __slots__ = ()
+    ruleIndex = 29
+
+    def oC_SortItem(self, i=None):
+        if i is None:
+            return self.getChildren(OC_SortItemContext)
+        return self.getChild(OC_SortItemContext, i)
+
+
+class OC_SkipContext(Node):
+    __slots__ = ()
+    ruleIndex = 30
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+
+class OC_LimitContext(Node):
+    __slots__ = ()
+    ruleIndex = 31
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+
+class OC_SortItemContext(Node):
+    __slots__ = ()
+    ruleIndex = 32
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+
+class OC_WhereContext(Node):
+    __slots__ = ()
+    ruleIndex = 33
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+
+class OC_PatternContext(Node):
+    __slots__ = ()
+    ruleIndex = 34
+
+    def oC_PatternPart(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PatternPartContext)
+        return self.getChild(OC_PatternPartContext, i)
+
+
+class OC_PatternPartContext(Node):
+    __slots__ = ()
+    ruleIndex = 35
+
+    def oC_AnonymousPatternPart(self):
+        return self.getChild(OC_AnonymousPatternPartContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_AnonymousPatternPartContext(Node):
+    __slots__ = ()
+    ruleIndex = 36
+
+    def oC_PatternElement(self):
+        return self.getChild(OC_PatternElementContext, 0)
+
+
+class OC_PatternElementContext(Node):
+    __slots__ = ()
+    ruleIndex = 37
+
+    def oC_NodePattern(self):
+        return self.getChild(OC_NodePatternContext, 0)
+
+    def oC_PatternElement(self):
+        return self.getChild(OC_PatternElementContext, 0)
+
+    def oC_PatternElementChain(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PatternElementChainContext)
+        return self.getChild(OC_PatternElementChainContext, i)
+
+
+class OC_NodePatternContext(Node):
+    __slots__ = ()
+    ruleIndex = 38
+
+    def oC_NodeLabels(self):
+        return self.getChild(OC_NodeLabelsContext, 0)
+
+    def oC_Properties(self):
+        return self.getChild(OC_PropertiesContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_PatternElementChainContext(Node):
+    __slots__ = ()
+    ruleIndex = 39
+
+    def oC_NodePattern(self):
+        return self.getChild(OC_NodePatternContext, 0)
+
+    def oC_RelationshipPattern(self):
+        return self.getChild(OC_RelationshipPatternContext, 0)
+
+
+class OC_RelationshipPatternContext(Node):
+    __slots__ = ()
+    ruleIndex = 40
+
+    def oC_Dash(self, i=None):
+        if i is None:
+            return self.getChildren(OC_DashContext)
+        return self.getChild(OC_DashContext, i)
+
+    def oC_LeftArrowHead(self):
+        return self.getChild(OC_LeftArrowHeadContext, 0)
+
+    def oC_RelationshipDetail(self):
+        return self.getChild(OC_RelationshipDetailContext, 0)
+
+    def oC_RightArrowHead(self):
+        return self.getChild(OC_RightArrowHeadContext, 0)
+
+
+class OC_RelationshipDetailContext(Node):
+    __slots__ = ()
+    ruleIndex = 41
+
+    def oC_Properties(self):
+        return self.getChild(OC_PropertiesContext, 0)
+
+    def oC_RangeLiteral(self):
+        return self.getChild(OC_RangeLiteralContext, 0)
+
+    def oC_RelationshipTypes(self):
+        return self.getChild(OC_RelationshipTypesContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_PropertiesContext(Node):
+    __slots__ = ()
+    ruleIndex = 42
+
+    def oC_MapLiteral(self):
+        return self.getChild(OC_MapLiteralContext, 0)
+
+    def oC_Parameter(self):
+        return self.getChild(OC_ParameterContext, 0)
+
+
+class OC_RelationshipTypesContext(Node):
+    __slots__ = ()
+    ruleIndex = 43
+
+    def oC_RelTypeName(self, i=None):
+        if i is None:
+            return self.getChildren(OC_RelTypeNameContext)
+        return self.getChild(OC_RelTypeNameContext, i)
+
+
+class OC_NodeLabelsContext(Node):
+    __slots__ = ()
+    ruleIndex = 44
+
+    def oC_NodeLabel(self, i=None):
+        if i is None:
+            return self.getChildren(OC_NodeLabelContext)
+        return self.getChild(OC_NodeLabelContext, i)
+
+
+class OC_NodeLabelContext(Node):
+    __slots__ = ()
+    ruleIndex = 45
+
+    def oC_LabelName(self):
+        return self.getChild(OC_LabelNameContext, 0)
+
+
+class OC_RangeLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 46
+
+    def oC_IntegerLiteral(self, i=None):
+        if i is None:
+            return self.getChildren(OC_IntegerLiteralContext)
+        return self.getChild(OC_IntegerLiteralContext, i)
+
+
+class OC_LabelNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 47
+
+    def oC_SchemaName(self):
+        return self.getChild(OC_SchemaNameContext, 0)
+
+
+class OC_RelTypeNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 48
+
+    def oC_SchemaName(self):
+        return self.getChild(OC_SchemaNameContext, 0)
+
+
+class OC_ExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 49
+
+    def oC_OrExpression(self):
+        return self.getChild(OC_OrExpressionContext, 0)
+
+
+class OC_OrExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 50
+
+    def oC_XorExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_XorExpressionContext)
+        return self.getChild(OC_XorExpressionContext, i)
+
+
+class OC_XorExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 51
+
+    def oC_AndExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_AndExpressionContext)
+        return self.getChild(OC_AndExpressionContext, i)
+
+
+class OC_AndExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 52
+
+    def oC_NotExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_NotExpressionContext)
+        return self.getChild(OC_NotExpressionContext, i)
+
+
+class OC_NotExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 53
+
+    def oC_ComparisonExpression(self):
+        return self.getChild(OC_ComparisonExpressionContext, 0)
+
+
+class OC_ComparisonExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 54
+
+    def oC_AddOrSubtractExpression(self):
+        return self.getChild(OC_AddOrSubtractExpressionContext, 0)
+
+    def oC_PartialComparisonExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PartialComparisonExpressionContext)
+        return self.getChild(OC_PartialComparisonExpressionContext, i)
+
+
+class OC_AddOrSubtractExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 55
+
+    def oC_MultiplyDivideModuloExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_MultiplyDivideModuloExpressionContext)
+        return self.getChild(OC_MultiplyDivideModuloExpressionContext, i)
+
+
+class OC_MultiplyDivideModuloExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 56
+
+    def oC_PowerOfExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PowerOfExpressionContext)
+        return self.getChild(OC_PowerOfExpressionContext, i)
+
+
+class OC_PowerOfExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 57
+
+    def oC_UnaryAddOrSubtractExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_UnaryAddOrSubtractExpressionContext)
+        return self.getChild(OC_UnaryAddOrSubtractExpressionContext, i)
+
+
+class OC_UnaryAddOrSubtractExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 58
+
+    def oC_StringListNullOperatorExpression(self):
+        return self.getChild(OC_StringListNullOperatorExpressionContext, 0)
+
+
+class OC_StringListNullOperatorExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 59
+
+    def oC_ListOperatorExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ListOperatorExpressionContext)
+        return self.getChild(OC_ListOperatorExpressionContext, i)
+
+    def oC_NullOperatorExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_NullOperatorExpressionContext)
+        return self.getChild(OC_NullOperatorExpressionContext, i)
+
+    def oC_PropertyOrLabelsExpression(self):
+        return self.getChild(OC_PropertyOrLabelsExpressionContext, 0)
+
+    def oC_StringOperatorExpression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_StringOperatorExpressionContext)
+        return self.getChild(OC_StringOperatorExpressionContext, i)
+
+
+class OC_ListOperatorExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 60
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+    def oC_PropertyOrLabelsExpression(self):
+        return self.getChild(OC_PropertyOrLabelsExpressionContext, 0)
+
+
+class OC_StringOperatorExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 61
+
+    def oC_PropertyOrLabelsExpression(self):
+        return self.getChild(OC_PropertyOrLabelsExpressionContext, 0)
+
+
+class OC_NullOperatorExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 62
+
+
+class OC_PropertyOrLabelsExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 63
+
+    def oC_Atom(self):
+        return self.getChild(OC_AtomContext, 0)
+
+    def oC_NodeLabels(self):
+        return self.getChild(OC_NodeLabelsContext, 0)
+
+    def oC_PropertyLookup(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PropertyLookupContext)
+        return self.getChild(OC_PropertyLookupContext, i)
+
+
+class OC_AtomContext(Node):
+    __slots__ = ()
+    ruleIndex = 64
+
+    def oC_CaseExpression(self):
+        return self.getChild(OC_CaseExpressionContext, 0)
+
+    def oC_ExistentialSubquery(self):
+        return self.getChild(OC_ExistentialSubqueryContext, 0)
+
+    def oC_FilterExpression(self):
+        return self.getChild(OC_FilterExpressionContext, 0)
+
+    def oC_FunctionInvocation(self):
+        return self.getChild(OC_FunctionInvocationContext, 0)
+
+    def oC_ListComprehension(self):
+        return self.getChild(OC_ListComprehensionContext, 0)
+
+    def oC_Literal(self):
+        return self.getChild(OC_LiteralContext, 0)
+
+    def oC_Parameter(self):
+        return self.getChild(OC_ParameterContext, 0)
+
+    def oC_ParenthesizedExpression(self):
+        return self.getChild(OC_ParenthesizedExpressionContext, 0)
+
+    def oC_PatternComprehension(self):
+        return self.getChild(OC_PatternComprehensionContext, 0)
+
+    def oC_RelationshipsPattern(self):
+        return self.getChild(OC_RelationshipsPatternContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_LiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 65
+
+    def oC_BooleanLiteral(self):
+        return self.getChild(OC_BooleanLiteralContext, 0)
+
+    def oC_ListLiteral(self):
+        return self.getChild(OC_ListLiteralContext, 0)
+
+    def oC_MapLiteral(self):
+        return self.getChild(OC_MapLiteralContext, 0)
+
+    def oC_NumberLiteral(self):
+        return self.getChild(OC_NumberLiteralContext, 0)
+
+
+class OC_BooleanLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 66
+
+
+class OC_ListLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 67
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+
+class OC_PartialComparisonExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 68
+
+    def oC_AddOrSubtractExpression(self):
+        return self.getChild(OC_AddOrSubtractExpressionContext, 0)
+
+
+class OC_ParenthesizedExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 69
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+
+class OC_RelationshipsPatternContext(Node):
+    __slots__ = ()
+    ruleIndex = 70
+
+    def oC_NodePattern(self):
+        return self.getChild(OC_NodePatternContext, 0)
+
+    def oC_PatternElementChain(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PatternElementChainContext)
+        return self.getChild(OC_PatternElementChainContext, i)
+
+
+class OC_FilterExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 71
+
+    def oC_IdInColl(self):
+        return self.getChild(OC_IdInCollContext, 0)
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+
+class OC_IdInCollContext(Node):
+    __slots__ = ()
+    ruleIndex = 72
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+
+class OC_FunctionInvocationContext(Node):
+    __slots__ = ()
+    ruleIndex = 73
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+    def oC_FunctionName(self):
+        return self.getChild(OC_FunctionNameContext, 0)
+
+
+class OC_FunctionNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 74
+
+    def oC_Namespace(self):
+        return self.getChild(OC_NamespaceContext, 0)
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_ExistentialSubqueryContext(Node):
+    __slots__ = ()
+    ruleIndex = 75
+
+    def oC_Pattern(self):
+        return self.getChild(OC_PatternContext, 0)
+
+    def oC_RegularQuery(self):
+        return self.getChild(OC_RegularQueryContext, 0)
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+
+class OC_ExplicitProcedureInvocationContext(Node):
+    __slots__ = ()
+    ruleIndex = 76
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+    def oC_ProcedureName(self):
+        return self.getChild(OC_ProcedureNameContext, 0)
+
+
+class OC_ImplicitProcedureInvocationContext(Node):
+    __slots__ = ()
+    ruleIndex = 77
+
+    def oC_ProcedureName(self):
+        return self.getChild(OC_ProcedureNameContext, 0)
+
+
+class OC_ProcedureResultFieldContext(Node):
+    __slots__ = ()
+    ruleIndex = 78
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_ProcedureNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 79
+
+    def oC_Namespace(self):
+        return self.getChild(OC_NamespaceContext, 0)
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_NamespaceContext(Node):
+    __slots__ = ()
+    ruleIndex = 80
+
+    def oC_SymbolicName(self, i=None):
+        if i is None:
+            return self.getChildren(OC_SymbolicNameContext)
+        return self.getChild(OC_SymbolicNameContext, i)
+
+
+class OC_ListComprehensionContext(Node):
+    __slots__ = ()
+    ruleIndex = 81
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_FilterExpression(self):
+        return self.getChild(OC_FilterExpressionContext, 0)
+
+
+class OC_PatternComprehensionContext(Node):
+    __slots__ = ()
+    ruleIndex = 82
+
+    def oC_Expression(self):
+        return self.getChild(OC_ExpressionContext, 0)
+
+    def oC_RelationshipsPattern(self):
+        return self.getChild(OC_RelationshipsPatternContext, 0)
+
+    def oC_Variable(self):
+        return self.getChild(OC_VariableContext, 0)
+
+    def oC_Where(self):
+        return self.getChild(OC_WhereContext, 0)
+
+
+class OC_PropertyLookupContext(Node):
+    __slots__ = ()
+    ruleIndex = 83
+
+    def oC_PropertyKeyName(self):
+        return self.getChild(OC_PropertyKeyNameContext, 0)
+
+
+class OC_CaseExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 84
+
+    def oC_CaseAlternative(self, i=None):
+        if i is None:
+            return self.getChildren(OC_CaseAlternativeContext)
+        return self.getChild(OC_CaseAlternativeContext, i)
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+
+class OC_CaseAlternativeContext(Node):
+    __slots__ = ()
+    ruleIndex = 85
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+
+class OC_VariableContext(Node):
+    __slots__ = ()
+    ruleIndex = 86
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_NumberLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 87
+
+    def oC_DoubleLiteral(self):
+        return self.getChild(OC_DoubleLiteralContext, 0)
+
+    def oC_IntegerLiteral(self):
+        return self.getChild(OC_IntegerLiteralContext, 0)
+
+
+class OC_MapLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 88
+
+    def oC_Expression(self, i=None):
+        if i is None:
+            return self.getChildren(OC_ExpressionContext)
+        return self.getChild(OC_ExpressionContext, i)
+
+    def oC_PropertyKeyName(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PropertyKeyNameContext)
+        return self.getChild(OC_PropertyKeyNameContext, i)
+
+
+class OC_ParameterContext(Node):
+    __slots__ = ()
+    ruleIndex = 89
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_PropertyExpressionContext(Node):
+    __slots__ = ()
+    ruleIndex = 90
+
+    def oC_Atom(self):
+        return self.getChild(OC_AtomContext, 0)
+
+    def oC_PropertyLookup(self, i=None):
+        if i is None:
+            return self.getChildren(OC_PropertyLookupContext)
+        return self.getChild(OC_PropertyLookupContext, i)
+
+
+class OC_PropertyKeyNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 91
+
+    def oC_SchemaName(self):
+        return self.getChild(OC_SchemaNameContext, 0)
+
+
+class OC_IntegerLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 92
+
+
+class OC_DoubleLiteralContext(Node):
+    __slots__ = ()
+    ruleIndex = 93
+
+
+class OC_SchemaNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 94
+
+    def oC_ReservedWord(self):
+        return self.getChild(OC_ReservedWordContext, 0)
+
+    def oC_SymbolicName(self):
+        return self.getChild(OC_SymbolicNameContext, 0)
+
+
+class OC_ReservedWordContext(Node):
+    __slots__ = ()
+    ruleIndex = 95
+
+
+class OC_SymbolicNameContext(Node):
+    __slots__ = ()
+    ruleIndex = 96
+
+
+class OC_LeftArrowHeadContext(Node):
+    __slots__ = ()
+    ruleIndex = 97
+
+
+class OC_RightArrowHeadContext(Node):
+    __slots__ = ()
+    ruleIndex = 98
+
+
+class OC_DashContext(Node):
+    __slots__ = ()
+    ruleIndex = 99
+
+
+RULE_CLASSES = (
+    OC_CypherContext,
+    OC_StatementContext,
+    OC_QueryContext,
+    OC_RegularQueryContext,
+    OC_UnionContext,
+    OC_SingleQueryContext,
+    OC_SinglePartQueryContext,
+    OC_MultiPartQueryContext,
+    OC_UpdatingClauseContext,
+    OC_ReadingClauseContext,
+    OC_MatchContext,
+    OC_UnwindContext,
+    OC_MergeContext,
+    OC_MergeActionContext,
+    OC_CreateContext,
+    OC_SetContext,
+    OC_SetItemContext,
+    OC_DeleteContext,
+    OC_RemoveContext,
+    OC_RemoveItemContext,
+    OC_InQueryCallContext,
+    OC_StandaloneCallContext,
+    OC_YieldItemsContext,
+    OC_YieldItemContext,
+    OC_WithContext,
+    OC_ReturnContext,
+    OC_ProjectionBodyContext,
+    OC_ProjectionItemsContext,
+    OC_ProjectionItemContext,
+    OC_OrderContext,
+    OC_SkipContext,
+    OC_LimitContext,
+    OC_SortItemContext,
+    OC_WhereContext,
+    OC_PatternContext,
+    OC_PatternPartContext,
+    OC_AnonymousPatternPartContext,
+    OC_PatternElementContext,
+    OC_NodePatternContext,
+    OC_PatternElementChainContext,
+    OC_RelationshipPatternContext,
+    OC_RelationshipDetailContext,
+    OC_PropertiesContext,
+    OC_RelationshipTypesContext,
+    OC_NodeLabelsContext,
+    OC_NodeLabelContext,
+    OC_RangeLiteralContext,
+    OC_LabelNameContext,
+    OC_RelTypeNameContext,
+    OC_ExpressionContext,
+    OC_OrExpressionContext,
+    OC_XorExpressionContext,
+    OC_AndExpressionContext,
+    OC_NotExpressionContext,
+    OC_ComparisonExpressionContext,
+    OC_AddOrSubtractExpressionContext,
+    OC_MultiplyDivideModuloExpressionContext,
+    OC_PowerOfExpressionContext,
+    OC_UnaryAddOrSubtractExpressionContext,
+    OC_StringListNullOperatorExpressionContext,
+    OC_ListOperatorExpressionContext,
+    OC_StringOperatorExpressionContext,
+    OC_NullOperatorExpressionContext,
+    OC_PropertyOrLabelsExpressionContext,
+    OC_AtomContext,
+    OC_LiteralContext,
+    OC_BooleanLiteralContext,
+    OC_ListLiteralContext,
+    OC_PartialComparisonExpressionContext,
+    OC_ParenthesizedExpressionContext,
+    OC_RelationshipsPatternContext,
+    OC_FilterExpressionContext,
+    OC_IdInCollContext,
+    OC_FunctionInvocationContext,
+    OC_FunctionNameContext,
+    OC_ExistentialSubqueryContext,
+    OC_ExplicitProcedureInvocationContext,
+    OC_ImplicitProcedureInvocationContext,
+    OC_ProcedureResultFieldContext,
+    OC_ProcedureNameContext,
+    OC_NamespaceContext,
+    OC_ListComprehensionContext,
+    OC_PatternComprehensionContext,
+    OC_PropertyLookupContext,
+    OC_CaseExpressionContext,
+    OC_CaseAlternativeContext,
+    OC_VariableContext,
+    OC_NumberLiteralContext,
+    OC_MapLiteralContext,
+    OC_ParameterContext,
+    OC_PropertyExpressionContext,
+    OC_PropertyKeyNameContext,
+    OC_IntegerLiteralContext,
+    OC_DoubleLiteralContext,
+    OC_SchemaNameContext,
+    OC_ReservedWordContext,
+    OC_SymbolicNameContext,
+    OC_LeftArrowHeadContext,
+    OC_RightArrowHeadContext,
+    OC_DashContext,
+)
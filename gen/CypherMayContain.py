@@ -0,0 +1,7193 @@
+# Generated by create_may_contain.py from CypherParser, do not edit.
+MAY_CONTAIN = {
+    'OC_AddOrSubtractExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_AndExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_AnonymousPatternPartContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_AtomContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_BooleanLiteralContext': frozenset({
+    }),
+    'OC_CaseAlternativeContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_CaseExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ComparisonExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_CreateContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_CypherContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_ImplicitProcedureInvocationContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_QueryContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StandaloneCallContext',
+        'OC_StatementContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_DashContext': frozenset({
+    }),
+    'OC_DeleteContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_DoubleLiteralContext': frozenset({
+    }),
+    'OC_ExistentialSubqueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ExplicitProcedureInvocationContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_FilterExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_FunctionInvocationContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_FunctionNameContext': frozenset({
+        'OC_NamespaceContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_IdInCollContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ImplicitProcedureInvocationContext': frozenset({
+        'OC_NamespaceContext',
+        'OC_ProcedureNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_InQueryCallContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_IntegerLiteralContext': frozenset({
+    }),
+    'OC_LabelNameContext': frozenset({
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_LeftArrowHeadContext': frozenset({
+    }),
+    'OC_LimitContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ListComprehensionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ListLiteralContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ListOperatorExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_LiteralContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MapLiteralContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MatchContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MergeActionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MergeContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MultiPartQueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_MultiplyDivideModuloExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_NamespaceContext': frozenset({
+        'OC_SymbolicNameContext',
+    }),
+    'OC_NodeLabelContext': frozenset({
+        'OC_LabelNameContext',
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_NodeLabelsContext': frozenset({
+        'OC_LabelNameContext',
+        'OC_NodeLabelContext',
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_NodePatternContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_NotExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_NullOperatorExpressionContext': frozenset({
+    }),
+    'OC_NumberLiteralContext': frozenset({
+        'OC_DoubleLiteralContext',
+        'OC_IntegerLiteralContext',
+    }),
+    'OC_OrExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_OrderContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ParameterContext': frozenset({
+        'OC_SymbolicNameContext',
+    }),
+    'OC_ParenthesizedExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PartialComparisonExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PatternComprehensionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PatternContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PatternElementChainContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PatternElementContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PatternPartContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PowerOfExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ProcedureNameContext': frozenset({
+        'OC_NamespaceContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_ProcedureResultFieldContext': frozenset({
+        'OC_SymbolicNameContext',
+    }),
+    'OC_ProjectionBodyContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ProjectionItemContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ProjectionItemsContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PropertiesContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PropertyExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_PropertyKeyNameContext': frozenset({
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_PropertyLookupContext': frozenset({
+        'OC_PropertyKeyNameContext',
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_PropertyOrLabelsExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_QueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_ImplicitProcedureInvocationContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StandaloneCallContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RangeLiteralContext': frozenset({
+        'OC_IntegerLiteralContext',
+    }),
+    'OC_ReadingClauseContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RegularQueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RelTypeNameContext': frozenset({
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_RelationshipDetailContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RelationshipPatternContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RelationshipTypesContext': frozenset({
+        'OC_RelTypeNameContext',
+        'OC_ReservedWordContext',
+        'OC_SchemaNameContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_RelationshipsPatternContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RemoveContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RemoveItemContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_ReservedWordContext': frozenset({
+    }),
+    'OC_ReturnContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_RightArrowHeadContext': frozenset({
+    }),
+    'OC_SchemaNameContext': frozenset({
+        'OC_ReservedWordContext',
+        'OC_SymbolicNameContext',
+    }),
+    'OC_SetContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SetItemContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SinglePartQueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SingleQueryContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SkipContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SortItemContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_StandaloneCallContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_ImplicitProcedureInvocationContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_StatementContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_ImplicitProcedureInvocationContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_QueryContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StandaloneCallContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_StringListNullOperatorExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_StringOperatorExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_SymbolicNameContext': frozenset({
+    }),
+    'OC_UnaryAddOrSubtractExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_UnionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_UnwindContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_UpdatingClauseContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_VariableContext': frozenset({
+        'OC_SymbolicNameContext',
+    }),
+    'OC_WhereContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_WithContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_XorExpressionContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+    'OC_YieldItemContext': frozenset({
+        'OC_ProcedureResultFieldContext',
+        'OC_SymbolicNameContext',
+        'OC_VariableContext',
+    }),
+    'OC_YieldItemsContext': frozenset({
+        'OC_AddOrSubtractExpressionContext',
+        'OC_AndExpressionContext',
+        'OC_AnonymousPatternPartContext',
+        'OC_AtomContext',
+        'OC_BooleanLiteralContext',
+        'OC_CaseAlternativeContext',
+        'OC_CaseExpressionContext',
+        'OC_ComparisonExpressionContext',
+        'OC_CreateContext',
+        'OC_DashContext',
+        'OC_DeleteContext',
+        'OC_DoubleLiteralContext',
+        'OC_ExistentialSubqueryContext',
+        'OC_ExplicitProcedureInvocationContext',
+        'OC_ExpressionContext',
+        'OC_FilterExpressionContext',
+        'OC_FunctionInvocationContext',
+        'OC_FunctionNameContext',
+        'OC_IdInCollContext',
+        'OC_InQueryCallContext',
+        'OC_IntegerLiteralContext',
+        'OC_LabelNameContext',
+        'OC_LeftArrowHeadContext',
+        'OC_LimitContext',
+        'OC_ListComprehensionContext',
+        'OC_ListLiteralContext',
+        'OC_ListOperatorExpressionContext',
+        'OC_LiteralContext',
+        'OC_MapLiteralContext',
+        'OC_MatchContext',
+        'OC_MergeActionContext',
+        'OC_MergeContext',
+        'OC_MultiPartQueryContext',
+        'OC_MultiplyDivideModuloExpressionContext',
+        'OC_NamespaceContext',
+        'OC_NodeLabelContext',
+        'OC_NodeLabelsContext',
+        'OC_NodePatternContext',
+        'OC_NotExpressionContext',
+        'OC_NullOperatorExpressionContext',
+        'OC_NumberLiteralContext',
+        'OC_OrExpressionContext',
+        'OC_OrderContext',
+        'OC_ParameterContext',
+        'OC_ParenthesizedExpressionContext',
+        'OC_PartialComparisonExpressionContext',
+        'OC_PatternComprehensionContext',
+        'OC_PatternContext',
+        'OC_PatternElementChainContext',
+        'OC_PatternElementContext',
+        'OC_PatternPartContext',
+        'OC_PowerOfExpressionContext',
+        'OC_ProcedureNameContext',
+        'OC_ProcedureResultFieldContext',
+        'OC_ProjectionBodyContext',
+        'OC_ProjectionItemContext',
+        'OC_ProjectionItemsContext',
+        'OC_PropertiesContext',
+        'OC_PropertyExpressionContext',
+        'OC_PropertyKeyNameContext',
+        'OC_PropertyLookupContext',
+        'OC_PropertyOrLabelsExpressionContext',
+        'OC_RangeLiteralContext',
+        'OC_ReadingClauseContext',
+        'OC_RegularQueryContext',
+        'OC_RelTypeNameContext',
+        'OC_RelationshipDetailContext',
+        'OC_RelationshipPatternContext',
+        'OC_RelationshipTypesContext',
+        'OC_RelationshipsPatternContext',
+        'OC_RemoveContext',
+        'OC_RemoveItemContext',
+        'OC_ReservedWordContext',
+        'OC_ReturnContext',
+        'OC_RightArrowHeadContext',
+        'OC_SchemaNameContext',
+        'OC_SetContext',
+        'OC_SetItemContext',
+        'OC_SinglePartQueryContext',
+        'OC_SingleQueryContext',
+        'OC_SkipContext',
+        'OC_SortItemContext',
+        'OC_StringListNullOperatorExpressionContext',
+        'OC_StringOperatorExpressionContext',
+        'OC_SymbolicNameContext',
+        'OC_UnaryAddOrSubtractExpressionContext',
+        'OC_UnionContext',
+        'OC_UnwindContext',
+        'OC_UpdatingClauseContext',
+        'OC_VariableContext',
+        'OC_WhereContext',
+        'OC_WithContext',
+        'OC_XorExpressionContext',
+        'OC_YieldItemContext',
+        'OC_YieldItemsContext',
+    }),
+}
@@ -0,0 +1,92 @@
+# Writes CypherAST.py: one __slots__ node class per grammar rule, with the
+# same names and rule accessors as the contexts in CypherParser.
+import inspect
+
+from CypherParser import CypherParser
+
+HEADER = '''\
+# Generated by create_cypher_ast.py from CypherParser, do not edit.
+
+
+class Node:
+    """A parse tree node without the parser bookkeeping of ParserRuleContext.
+
+    `start` and `stop` are character offsets into `source`, inclusive.
+    """
+
+    __slots__ = ("parentCtx", "children", "start", "stop", "line", "column", "source")
+    ruleIndex = -1
+
+    def __init__(self, parentCtx, start, stop, line, column, source):
+        self.parentCtx = parentCtx
+        self.children = ()
+        self.start = start
+        self.stop = stop
+        self.line = line
+        self.column = column
+        self.source = source
+
+    def getRuleIndex(self):
+        return self.ruleIndex
+
+    def getText(self):
+        return self.source[self.start:self.stop + 1]
+
+    def getChild(self, ctxType, i):
+        for child in self.children:
+            if isinstance(child, ctxType):
+                if i == 0:
+                    return child
+                i -= 1
+        return None
+
+    def getChildren(self, ctxType):
+        return [child for child in self.children if isinstance(child, ctxType)]
+
+
+class Terminal:
+    __slots__ = ("parentCtx", "type", "start", "stop", "line", "column", "source")
+
+    def __init__(self, parentCtx, type, start, stop, line, column, source):
+        self.parentCtx = parentCtx
+        self.type = type
+        self.start = start
+        self.stop = stop
+        self.line = line
+        self.column = column
+        self.source = source
+
+    def getText(self):
+        return self.source[self.start:self.stop + 1]
+'''
+
+
+def className(rule):
+    return rule.replace('oC', 'OC', 1) + 'Context'
+
+
+print(HEADER)
+for index, rule in enumerate(CypherParser.ruleNames):
+    ctx = getattr(CypherParser, className(rule))
+    print()
+    print(f"class {className(rule)}(Node):")
+    print("    __slots__ = ()")
+    print(f"    ruleIndex = {index}")
+    for accessor in sorted(a for a in dir(ctx) if a.startswith('oC')):
+        child = className(accessor)
+        print()
+        if 'i' in inspect.signature(getattr(ctx, accessor)).parameters:
+            print(f"    def {accessor}(self, i=None):")
+            print("        if i is None:")
+            print(f"            return self.getChildren({child})")
+            print(f"        return self.getChild({child}, i)")
+        else:
+            print(f"    def {accessor}(self):")
+            print(f"        return self.getChild({child}, 0)")
+    print()
+
+print()
+print("RULE_CLASSES = (")
+for rule in CypherParser.ruleNames:
+    print(f"    {className(rule)},")
+print(")")
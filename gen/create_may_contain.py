@@ -0,0 +1,29 @@
+# Writes CypherMayContain.py: for every rule context, the set of rule contexts
+# that can appear anywhere below it in a parse tree.
+from CypherParser import CypherParser
+
+all_ctxs = sorted(
+    name for name in dir(CypherParser)
+    if name.startswith('OC_') and name.endswith('Context')
+)
+
+children = {}
+for ctx in all_ctxs:
+    accessors = [c for c in dir(getattr(CypherParser, ctx)) if c.startswith('oC')]
+    children[ctx] = {c.replace('oC', 'OC', 1) + 'Context' for c in accessors}
+
+print("# Generated by create_may_contain.py from CypherParser, do not edit.")
+print("MAY_CONTAIN = {")
+for ctx in all_ctxs:
+    reachable = set()
+    stack = list(children[ctx])
+    while stack:
+        child = stack.pop()
+        if child not in reachable:
+            reachable.add(child)
+            stack.extend(children[child])
+    print(f"    {ctx!r}: frozenset({{")
+    for child in sorted(reachable):
+        print(f"        {child!r},")
+    print("    }),")
+print("}")
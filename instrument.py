@@ -0,0 +1,142 @@
+import json
+import time
+
+from collections import defaultdict
+
+RULE_PREFIX = "rule."
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Stats:
+    """Per-phase timers and counters for a lint run.
+
+    Everything is a no-op until `enabled` is set: phase() hands back a
+    shared do-nothing context manager and count() returns straight away, so
+    the instrumentation points can stay in the hot paths. Timers use the
+    monotonic perf_counter and are inclusive, so nested phases (such as
+    scope.check inside scope) are also counted in their parent.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.started = time.perf_counter()
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def add(self, name: str, seconds: float):
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            self.counters[name] += n
+
+    def snapshot(self) -> dict:
+        return {
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+        }
+
+    def merge(self, snapshot: dict):
+        """Add a snapshot taken in another process."""
+        for name, seconds in snapshot["seconds"].items():
+            self.seconds[name] += seconds
+        for name, calls in snapshot["calls"].items():
+            self.calls[name] += calls
+        for name, n in snapshot["counters"].items():
+            self.counters[name] += n
+
+    def summary(self) -> dict:
+        """Totals, with grammar rule timings (named rule.<rule>, see
+        parsing.RuleTimer) apart from the phases."""
+        elapsed = time.perf_counter() - self.started
+        queries = self.counters.get("queries", 0)
+        phases = {}
+        rules = {}
+        for name in sorted(self.seconds):
+            timing = {"seconds": self.seconds[name], "calls": self.calls[name]}
+            if name.startswith(RULE_PREFIX):
+                rules[name[len(RULE_PREFIX) :]] = timing
+            else:
+                phases[name] = timing
+        return {
+            "elapsed": elapsed,
+            "queries_per_second": queries / elapsed if elapsed else 0,
+            "phases": phases,
+            "rules": rules,
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def report(self, out, format: str = "summary", rules: int = 10):
+        """Write the summary as text, with only the `rules` slowest grammar
+        rules, or all of it as JSON."""
+        summary = self.summary()
+        if format == "json":
+            out.write(json.dumps(summary, indent=2) + "\n")
+            return
+
+        lines = [
+            f"{self.counters.get('queries', 0)} queries in "
+            f"{summary['elapsed']:.3f}s ({summary['queries_per_second']:.1f}/s)"
+        ]
+        slowest = sorted(
+            summary["rules"].items(), key=lambda item: item[1]["seconds"], reverse=True
+        )[:rules]
+        width = max(map(len, [*summary["phases"], *dict(slowest)]), default=0)
+
+        def timings(items):
+            for name, timing in items:
+                lines.append(
+                    f"  {name:<{width}} {timing['seconds'] * 1000:>10.2f}ms "
+                    f"{timing['calls']:>8} calls"
+                )
+
+        timings(summary["phases"].items())
+        if slowest:
+            lines.append("slowest grammar rules (inclusive):")
+            timings(slowest)
+        for name, n in summary["counters"].items():
+            if name != "queries":
+                lines.append(f"  {name}: {n}")
+        out.write("\n".join(lines) + "\n")
+
+
+stats = Stats()
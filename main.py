@@ -1,51 +1,75 @@
 #!/usr/bin/python3
+import time
+
+_start_time = time.perf_counter()
+
 import argparse
+import atexit
+import os
 import sys
 
 from dataclasses import dataclass
 from typing import Dict, List
 
+import snapshot
+
+snapshot.installATNSnapshots()
+
 from antlr4 import *
 
-from gen.CypherLexer import CypherLexer
+from gen import CypherAST
 from gen.CypherParser import CypherParser
 
+from diagnostics import RENDERERS, Diagnostic
+from instrument import stats
+import parsing
+from parsing import getAST, getSession
+from positions import LineIndex
+from slim import toSlim
+from splitter import splitFile
 from visitor import *
 
+_import_time = time.perf_counter()
+
+# Results are cached under these and a hash of the sources (see
+# cache.sourceDigest), so cached findings never outlive a code change
+VERSION = "0.2"
+RULES = ("SyntaxError", "UndefinedVariable")
+
 
 @dataclass
 class Variable:
-    ctx: ParserRuleContext
+    ctx: CypherAST.Node
 
     @property
     def name(self):
-        return self.ctx.getText()
+        return spanText(self.ctx)
 
     @property
     def line(self):
-        return self.ctx.start.line
+        return self.ctx.line
 
     @property
     def col(self):
-        return self.ctx.start.column
+        return self.ctx.column
 
 
 class Scope:
     variables: Dict[str, Variable]
-    file_contents: List[str]
+    diagnostics: List[Diagnostic]
 
-    def __init__(self, file_contents):
+    def __init__(self):
         self.variables = {}
-        self.file_contents = file_contents
+        self.diagnostics = []
 
-    def log(self, msg, l, c):
-        print(f"{msg} on line: {l}, col: {c}", file=sys.stderr)
-        print(f"{self.file_contents[l - 1].strip()}", file=sys.stderr)
-        print(f"{' ' * c}^", file=sys.stderr)
+    def report(self, rule, message, ctx):
+        span = (ctx.start, ctx.stop + 1)
+        stats.count(f"diagnostics.{rule}")
+        self.diagnostics.append(Diagnostic(rule, message, ctx.line, ctx.column, span))
 
     def logUndefined(self, undefined_vars: List[Variable]):
         for var in undefined_vars:
-            self.log("UndefinedVariable", var.line, var.col)
+            self.report("UndefinedVariable", f"{var.name} is not defined", var.ctx)
 
     def add(self, variables: List[Variable]):
         for var in variables:
@@ -62,20 +86,21 @@ class Scope:
         def visit(ctx):
             nonlocal undefined_vars
 
-            if isinstance(ctx, CypherParser.OC_ExpressionContext):
+            if isinstance(ctx, CypherAST.OC_ExpressionContext):
                 # if this expression was a variable because of a projection,
                 # then stop here
-                if ctx.getText() in self.variables:
+                if spanText(ctx) in self.variables:
                     return False
                 # recursively search this expression and find all atoms
-            elif isinstance(ctx, CypherParser.OC_AtomContext):
+            elif isinstance(ctx, CypherAST.OC_AtomContext):
                 if vctx := ctx.oC_Variable():
-                    if vctx.getText() not in self.variables:
+                    if spanText(vctx) not in self.variables:
                         undefined_vars.append(Variable(vctx))
                         return False
-            return True
+            return mayContain(ctx, CypherAST.OC_AtomContext)
 
-        visitor(ctx, visit)
+        with stats.phase("scope.check"):
+            visitor(ctx, visit)
 
         self.logUndefined(undefined_vars)
         return len(undefined_vars)
@@ -94,24 +119,25 @@ def extractDefinedVariables(ctx):
     def visit(ctx):
         # These are all clauses that can define variables
         defining_clauses = (
-            CypherParser.OC_ProjectionItemContext,
-            CypherParser.OC_UnwindContext,
-            CypherParser.OC_YieldItemContext,
-            CypherParser.OC_NodePatternContext,
-            CypherParser.OC_RelationshipDetailContext,
+            CypherAST.OC_ProjectionItemContext,
+            CypherAST.OC_UnwindContext,
+            CypherAST.OC_YieldItemContext,
+            CypherAST.OC_NodePatternContext,
+            CypherAST.OC_RelationshipDetailContext,
         )
         if isinstance(ctx, defining_clauses):
             if vctx := ctx.oC_Variable():
                 variables.append(Variable(vctx))
-            elif isinstance(ctx, CypherParser.OC_ProjectionItemContext):
+            elif isinstance(ctx, CypherAST.OC_ProjectionItemContext):
                 # If a projection is just an expression with no "AS" that
                 # expression gets propogated as a column name
                 expr = ctx.oC_Expression()
                 variables.append(Variable(expr))
             return False
-        return True
+        return mayContain(ctx, defining_clauses)
 
-    visitor(ctx, visit)
+    with stats.phase("scope.define"):
+        visitor(ctx, visit)
     return variables
 
 
@@ -131,70 +157,170 @@ def processQuery(scope: Scope, queryCtx) -> int:
     errors = 0
     children = queryCtx.children
     for child in children:
-        if isinstance(child, CypherParser.OC_ReadingClauseContext):
+        if isinstance(child, CypherAST.OC_ReadingClauseContext):
             errors += handleCtx(scope, child)
-        elif isinstance(child, CypherParser.OC_UpdatingClauseContext):
+        elif isinstance(child, CypherAST.OC_UpdatingClauseContext):
             errors += handleUpdateCtx(scope, child)
-        elif isinstance(child, CypherParser.OC_WithContext):
+        elif isinstance(child, CypherAST.OC_WithContext):
             errors += handleCtx(scope, child)
-        elif isinstance(child, CypherParser.OC_ReturnContext):
+        elif isinstance(child, CypherAST.OC_ReturnContext):
             errors += handleCtx(scope, child)
-        elif isinstance(child, CypherParser.OC_SinglePartQueryContext):
+        elif isinstance(child, CypherAST.OC_SinglePartQueryContext):
             errors += processQuery(scope, child)
     return errors
 
 
-def getAST(query: str):
-    input_stream = InputStream(query)
-    lexer = CypherLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = CypherParser(stream)
-    return parser.oC_Cypher()
+def lint(text: str) -> List[Diagnostic]:
+    """Check one query and return what was found.
 
+    Queries that don't parse only get their SyntaxError diagnostics. Raises
+    AssertionError for queries the checker does not support yet.
+    """
+    stats.count("queries")
+    session = getSession()
+    tree = session.parse(text)
+    if errors := session.syntax_errors.diagnostics:
+        # The tree is whatever error recovery made of it, don't check that
+        stats.count("diagnostics.SyntaxError", len(errors))
+        return errors
+    return analyze(tree)
 
-def main(file_contents: List[str]) -> int:
-    scope = Scope(file_contents)
-    ast = getAST("".join(file_contents))
 
+def analyze(ast) -> List[Diagnostic]:
+    """The checks lint() runs on an already parsed oC_Cypher tree."""
+    scope = Scope()
     query = ast.oC_Statement().oC_Query()
-    assert not hasType(
-        query, CypherParser.OC_MergeContext
-    ), "Unsupported query - merge not implemented"
-    assert not hasType(
-        query, CypherParser.OC_UnionContext
-    ), "Unsupported query - union not implemented"
-    assert not hasType(
-        query, CypherParser.OC_WhereContext
-    ), "Unsupported query - where not implemented"
+    with stats.phase("precheck"):
+        index = NodeIndex(query)
+        assert not index.hasType(
+            query, CypherParser.OC_MergeContext
+        ), "Unsupported query - merge not implemented"
+        assert not index.hasType(
+            query, CypherParser.OC_UnionContext
+        ), "Unsupported query - union not implemented"
+        assert not index.hasType(
+            query, CypherParser.OC_WhereContext
+        ), "Unsupported query - where not implemented"
 
     if callquery := query.oC_StandaloneCall():
         if yield_items := callquery.oC_YieldItems():
             for yield_item in yield_items.oC_YieldItem():
                 # TODO ???
                 pass
-        return
+        return scope.diagnostics
 
     regular_query = query.oC_RegularQuery()
     assert regular_query
 
     single_query = regular_query.oC_SingleQuery()
 
-    return processQuery(scope, single_query.children[0])
+    with stats.phase("slim"):
+        tree = toSlim(single_query.children[0])
+    with stats.phase("scope"):
+        processQuery(scope, tree)
+    return scope.diagnostics
+
+
+def main(query: str, format: str = "text") -> int:
+    diagnostics = lint(query)
+    out = sys.stderr if format == "text" else sys.stdout
+    renderer = RENDERERS[format](out)
+    renderer.add(None, LineIndex(query), diagnostics)
+    renderer.close()
+    # Not the number of findings, exit statuses wrap around at 256
+    return 1 if diagnostics else 0
+
+
+def mainFile(path: str, format: str = "text") -> int:
+    """Lint each ';'-separated statement in the file at `path`.
+
+    A statement that can't be checked is reported, like batch.lintOne does,
+    and doesn't stop the rest of the file from being checked.
+    """
+    failures = 0
+    out = sys.stderr if format == "text" else sys.stdout
+    renderer = RENDERERS[format](out)
+    # The text output is the same as for --query, the others name the file
+    name = None if format == "text" else path
+    try:
+        for statement in splitFile(path):
+            lines = statement.lines()
+            diagnostics = []
+            message = ""
+            try:
+                diagnostics = statement.locate(lint(statement.text), lines)
+            except AssertionError as e:
+                message = f"{e}\n"
+            except Exception as e:
+                message = f"{type(e).__name__}: {e}\n"
+            renderer.add(name, lines, diagnostics, message)
+            failures += bool(diagnostics or message)
+    finally:
+        renderer.close()
+    return 1 if failures else 0
+
+
+def enableStats(format: str):
+    """Collect instrument.stats from now on and report them at exit."""
+    stats.enabled = True
+    stats.reset()
+
+    def report():
+        # Parse fallbacks are always counted, see parsing.ParseStats
+        stats.counters["LL fallbacks"] = parsing.stats.fallbacks
+        stats.report(sys.stderr, format)
+
+    atexit.register(report)
+
+
+def reportStartup():
+    total = _import_time - _start_time
+    print(f"startup: {total * 1000:.1f}ms importing", file=sys.stderr)
+    for load in snapshot.atn_loads:
+        print(
+            f"  {load.grammar} ATN: {load.seconds * 1000:.1f}ms ({load.source})",
+            file=sys.stderr,
+        )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--query", action="store")
     parser.add_argument("--file", action="store")
+    parser.add_argument(
+        "--dfa-cache",
+        nargs="?",
+        const="",
+        default=os.environ.get(snapshot.DFA_CACHE_ENV),
+        metavar="PATH",
+        help="load the parser's DFA from PATH and save it back at exit",
+    )
+    parser.add_argument("--timing", choices=["startup"])
+    parser.add_argument("--format", choices=list(RENDERERS), default="text")
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="summary",
+        choices=["summary", "json"],
+        help="print per-phase timings and counters to stderr at exit",
+    )
 
     args = parser.parse_args()
 
     assert args.query or args.file, "One of --query and --file is required!"
 
+    if args.timing == "startup":
+        reportStartup()
+
+    if args.dfa_cache is not None:
+        snapshot.enableDFACache(args.dfa_cache or None)
+
+    if args.stats:
+        enableStats(args.stats)
+
     input_stream = None
     scope = None
     if args.query:
-        sys.exit(main(args.query.split("\n")))
+        sys.exit(main(args.query, args.format))
     elif args.file:
-        with open(args.file) as f:
-            sys.exit(main(f.readlines()))
+        sys.exit(mainFile(args.file, args.format))
@@ -0,0 +1,186 @@
+import threading
+import time
+
+from antlr4 import *
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from gen.CypherLexer import CypherLexer
+from gen.CypherParser import CypherParser
+
+import instrument
+from diagnostics import Diagnostic
+from flat import FlatTree, FlatTreeBuilder
+
+
+class ParseStats:
+    """Counts how often the SLL pass had to be redone in full LL mode."""
+
+    def __init__(self):
+        self.parses = 0
+        self.fallbacks = 0
+
+    def __repr__(self):
+        return f"ParseStats(parses={self.parses}, fallbacks={self.fallbacks})"
+
+
+stats = ParseStats()
+
+
+def parseCypher(parser: CypherParser, onRetry=None):
+    """Parse oC_Cypher with SLL prediction, falling back to LL on failure.
+
+    SLL is much cheaper than full LL and gives the same tree for any input it
+    accepts, so only queries that SLL rejects (real syntax errors and the rare
+    grammar ambiguity) pay for a second, full LL parse. `onRetry` is called
+    before that second parse, for parse listeners that need to start over.
+    """
+    stats.parses += 1
+
+    listeners = parser._listeners
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return parser.oC_Cypher()
+    except ParseCancellationException:
+        stats.fallbacks += 1
+    finally:
+        parser._listeners = listeners
+        parser._errHandler = DefaultErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.LL
+
+    # Parser.reset fails while parse listeners are attached (setTrace tries
+    # to remove a None tracer from the listener list), so detach them for it
+    parse_listeners = parser._parseListeners
+    parser._parseListeners = None
+    parser.reset()
+    parser._parseListeners = parse_listeners
+    if onRetry is not None:
+        onRetry()
+    return parser.oC_Cypher()
+
+
+class SyntaxErrorListener(ErrorListener):
+    """Collects lexer and parser errors as SyntaxError diagnostics, instead
+    of the ConsoleErrorListener printing them."""
+
+    def __init__(self):
+        self.diagnostics = []
+
+    def reset(self):
+        # A new list rather than clear(), the old one may have been returned
+        self.diagnostics = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        if offendingSymbol is None:
+            # From the lexer, which has no token yet
+            span = (recognizer._tokenStartCharIndex, recognizer._input.index + 1)
+        else:
+            start = offendingSymbol.start
+            span = (start, max(offendingSymbol.stop + 1, start))
+        self.diagnostics.append(Diagnostic("SyntaxError", msg, line, column, span))
+
+
+class RuleTimer(ParseTreeListener):
+    """Times every grammar rule as the parser enters and leaves it."""
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.starts = []
+
+    def reset(self):
+        self.starts.clear()
+
+    def enterEveryRule(self, ctx):
+        self.starts.append(time.perf_counter())
+
+    def exitEveryRule(self, ctx):
+        rule = CypherParser.ruleNames[ctx.getRuleIndex()]
+        seconds = time.perf_counter() - self.starts.pop()
+        self.stats.add(instrument.RULE_PREFIX + rule, seconds)
+
+
+class ParserSession:
+    """A lexer/parser pair that is reset and reused for every query.
+
+    Building a CypherLexer, CommonTokenStream and CypherParser per query is a
+    measurable part of linting many small queries, so a session keeps one of
+    each and only swaps the input. Sessions are not thread-safe.
+
+    Syntax errors in the last query parsed are in `syntax_errors.diagnostics`;
+    nothing is printed.
+    """
+
+    def __init__(self):
+        self.lexer = CypherLexer(None)
+        self.stream = CommonTokenStream(self.lexer)
+        self.parser = CypherParser(self.stream)
+        self.syntax_errors = SyntaxErrorListener()
+        for recognizer in (self.lexer, self.parser):
+            recognizer.removeErrorListeners()
+            recognizer.addErrorListener(self.syntax_errors)
+
+    def setInput(self, query: str):
+        self.lexer.inputStream = InputStream(query)
+        self.stream.setTokenSource(self.lexer)
+        self.parser.setTokenStream(self.stream)
+        self.syntax_errors.reset()
+
+    def parse(self, query: str):
+        self.setInput(query)
+        if instrument.stats.enabled:
+            return self._parseInstrumented()
+        return parseCypher(self.parser)
+
+    def _parseInstrumented(self):
+        # Lex everything up front so lexing and parsing are timed apart
+        stats = instrument.stats
+        with stats.phase("lex"):
+            self.stream.fill()
+        stats.count("tokens", len(self.stream.tokens))
+        timer = RuleTimer(stats)
+        self.parser.addParseListener(timer)
+        try:
+            with stats.phase("parse"):
+                return parseCypher(self.parser, timer.reset)
+        finally:
+            self.parser.removeParseListener(timer)
+
+    def parseFlat(self, query: str) -> FlatTree:
+        """Parse straight into a FlatTree, without building a parse tree."""
+        builder = FlatTreeBuilder(query)
+        self.setInput(query)
+        self.parser.buildParseTrees = False
+        self.parser.addParseListener(builder)
+        try:
+            parseCypher(self.parser, builder.reset)
+        finally:
+            self.parser.removeParseListener(builder)
+            self.parser.buildParseTrees = True
+        builder.addTokens(self.stream.tokens)
+        return builder.tree
+
+    def parseAll(self, queries):
+        for query in queries:
+            yield self.parse(query)
+
+
+_session = None
+# The session is shared by the whole process and isn't thread-safe, so
+# threads that lint must hold this while they use it
+session_lock = threading.Lock()
+
+
+def getSession() -> ParserSession:
+    # Created lazily so that snapshot.loadParserDFA can still swap in a
+    # different DFA before the first parser binds to it.
+    global _session
+    if _session is None:
+        _session = ParserSession()
+    return _session
+
+
+def getAST(query: str):
+    return getSession().parse(query)
@@ -0,0 +1,58 @@
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Maps character offsets in `source` to lines and columns.
+
+    `source` can be a slice of a larger text, such as one statement of a
+    script: `offset`, `line` and `column` give the position of its first
+    character in that text, and offsets and line numbers passed in and out
+    are then those of the whole text. Lines are 1-based and columns 0-based,
+    like ANTLR tokens.
+    """
+
+    __slots__ = ("source", "offset", "line", "column", "starts")
+
+    def __init__(self, source: str, offset: int = 0, line: int = 1, column: int = 0):
+        self.source = source
+        self.offset = offset
+        self.line = line
+        self.column = column
+        starts = array("l", [0])
+        find = source.find
+        i = find("\n")
+        while i != -1:
+            starts.append(i + 1)
+            i = find("\n", i + 1)
+        self.starts = starts
+
+    def position(self, offset: int):
+        """(line, column) of the character at `offset`."""
+        offset -= self.offset
+        i = bisect_right(self.starts, offset) - 1
+        column = offset - self.starts[i]
+        if i == 0:
+            column += self.column
+        return self.line + i, column
+
+    def lineColumn(self, line: int) -> int:
+        """The column lineText(line) starts at."""
+        return self.column if line == self.line else 0
+
+    def lineText(self, line: int) -> str:
+        """Line `line` without its line break. The first line of a slice only
+        has the part of it inside the slice."""
+        i = line - self.line
+        start = self.starts[i]
+        if i + 1 < len(self.starts):
+            end = self.starts[i + 1] - 1
+        else:
+            end = len(self.source)
+        return self.source[start:end].rstrip("\r")
+
+    def snippet(self, offset: int) -> str:
+        """The line containing `offset`, with a caret under it."""
+        line, column = self.position(offset)
+        column -= self.lineColumn(line)
+        return f"{self.lineText(line)}\n{' ' * column}^"
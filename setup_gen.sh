@@ -13,3 +13,9 @@ cd gen
 cp ../openCypher/Cypher.g4 .
 ANTLR_JAR="tool/target/antlr4-4.9-4-SNAPSHOT-complete.jar"
 java -jar ../antlr4/$ANTLR_JAR -Dlanguage=Python3 ./Cypher.g4
+python3 create_may_contain.py > CypherMayContain.py
+python3 create_cypher_ast.py > CypherAST.py
+cd ..
+
+# Pre-built ATN snapshots, loaded by snapshot.installATNSnapshots at startup
+python3 snapshot.py
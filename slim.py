@@ -0,0 +1,81 @@
+from antlr4 import ParserRuleContext
+
+from gen.CypherAST import RULE_CLASSES, Terminal
+from gen.CypherParser import CypherParser
+
+# Rules that only encode operator precedence. With a single operand they
+# wrap their child without adding anything, which is the common case: every
+# atom in an expression sits under all of them. Per the grammar, a single
+# operand is never surrounded by SP, so such a wrapper has exactly one child.
+PRECEDENCE_RULES = frozenset((
+    CypherParser.OC_OrExpressionContext,
+    CypherParser.OC_XorExpressionContext,
+    CypherParser.OC_AndExpressionContext,
+    CypherParser.OC_NotExpressionContext,
+    CypherParser.OC_ComparisonExpressionContext,
+    CypherParser.OC_AddOrSubtractExpressionContext,
+    CypherParser.OC_MultiplyDivideModuloExpressionContext,
+    CypherParser.OC_PowerOfExpressionContext,
+    CypherParser.OC_UnaryAddOrSubtractExpressionContext,
+    CypherParser.OC_StringListNullOperatorExpressionContext,
+    CypherParser.OC_PropertyOrLabelsExpressionContext,
+))
+
+
+def skipWrappers(ctx):
+    while type(ctx) in PRECEDENCE_RULES and len(ctx.children) == 1:
+        ctx = ctx.children[0]
+    return ctx
+
+
+def toSlim(root):
+    """Convert the ANTLR tree below `root` to gen.CypherAST nodes.
+
+    SP terminals (and with them comments) and single-operand precedence
+    wrappers are left out, so an expression that is just an atom becomes
+    OC_Expression -> OC_Atom. Nodes keep character offsets, line and column,
+    and the query text, but no tokens, parser or token stream, so the ANTLR
+    tree can be dropped afterwards.
+    """
+    source = root.start.getInputStream().strdata
+    sp = CypherParser.SP
+
+    def convert(ctx, parent):
+        start, stop = ctx.start, ctx.stop
+        if stop is None or stop.stop < start.start:
+            end = start.start - 1
+        else:
+            end = stop.stop
+        return RULE_CLASSES[ctx.getRuleIndex()](
+            parent, start.start, end, start.line, start.column, source
+        )
+
+    slim_root = convert(root, None)
+    stack = [(root, slim_root)]
+    while stack:
+        ctx, node = stack.pop()
+        if not ctx.children:
+            continue
+        children = []
+        for child in ctx.children:
+            if isinstance(child, ParserRuleContext):
+                if type(child) in PRECEDENCE_RULES:
+                    child = skipWrappers(child)
+                slim_child = convert(child, node)
+                stack.append((child, slim_child))
+            else:
+                token = child.symbol
+                if token.type == sp:
+                    continue
+                slim_child = Terminal(
+                    node,
+                    token.type,
+                    token.start,
+                    token.stop,
+                    token.line,
+                    token.column,
+                    source,
+                )
+            children.append(slim_child)
+        node.children = children
+    return slim_root
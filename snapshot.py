@@ -0,0 +1,302 @@
+import atexit
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+
+from importlib import metadata
+
+import antlr4
+from antlr4.PredictionContext import (
+    ArrayPredictionContext,
+    PredictionContext,
+    SingletonPredictionContext,
+)
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNType import ATNType
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+
+# This module is imported before the generated lexer and parser so that it can
+# hook their ATN deserialization; anything under gen/ is imported lazily.
+
+DFA_CACHE_ENV = "CYPHERCHECK_DFA_CACHE"
+ATN_SNAPSHOT_ENV = "CYPHERCHECK_ATN_SNAPSHOT"
+GEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gen")
+
+# The ATN and DFA graphs are deeply linked, so pickling them recurses far past
+# the default limit. Dumps run on a helper thread with a stack that can take it.
+_DUMP_STACK_SIZE = 512 * 1024 * 1024
+_DUMP_RECURSION_LIMIT = 1000000
+
+# Singletons the ANTLR runtime compares by identity; they must come back as the
+# live objects rather than as copies.
+_SINGLETONS = {
+    "EMPTY": PredictionContext.EMPTY,
+    "ERROR": ATNSimulator.ERROR,
+    "NONE": SemanticContext.NONE,
+}
+
+
+def cacheDir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "cyphercheck")
+
+
+def runtimeVersion() -> str:
+    try:
+        return metadata.version("antlr4-python3-runtime")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def atnKey(serialized: str) -> str:
+    # Snapshots are pickled runtime objects, so they are only valid for the
+    # runtime version that made them as well as for the grammar
+    digest = hashlib.sha256(runtimeVersion().encode())
+    digest.update(serialized.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()[:16]
+
+
+class _Pickler(pickle.Pickler):
+    # Cached hash codes in the prediction graph are derived from str hashes,
+    # which are salted per process. They are dropped here and recomputed when
+    # the snapshot is loaded so that dict lookups keep working.
+
+    def persistent_id(self, obj):
+        for name, singleton in _SINGLETONS.items():
+            if obj is singleton:
+                return name
+        return None
+
+    def reducer_override(self, obj):
+        if type(obj) is SingletonPredictionContext:
+            return SingletonPredictionContext.create, (
+                obj.parentCtx,
+                obj.returnState,
+            )
+        if type(obj) is ArrayPredictionContext:
+            return ArrayPredictionContext, (obj.parents, obj.returnStates)
+        if type(obj) is ATNConfigSet and obj.cachedHashCode != -1:
+            state = {slot: getattr(obj, slot) for slot in ATNConfigSet.__slots__}
+            state["cachedHashCode"] = -1
+            return _newObject, (ATNConfigSet,), (None, state)
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return _SINGLETONS[pid]
+
+
+def _newObject(cls):
+    return cls.__new__(cls)
+
+
+def dumpSnapshot(path: str, key: str, payload):
+    """Atomically write `payload` to `path`, tagged with `key`."""
+    error = None
+
+    def dump():
+        nonlocal error
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(_DUMP_RECURSION_LIMIT)
+        try:
+            with open(tmp_path, "wb") as f:
+                pickler = _Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickler.dump(key)
+                pickler.dump(payload)
+        except BaseException as e:
+            error = e
+        finally:
+            sys.setrecursionlimit(limit)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    stack_size = threading.stack_size(_DUMP_STACK_SIZE)
+    try:
+        thread = threading.Thread(target=dump)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(stack_size)
+
+    if error is not None:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise error
+    os.replace(tmp_path, path)
+
+
+def loadSnapshot(path: str, key: str):
+    """Return the payload stored at `path`, or None if missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            unpickler = _Unpickler(f)
+            if unpickler.load() != key:
+                return None
+            return unpickler.load()
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def atnSnapshotPath(key: str, directory: str = GEN_DIR) -> str:
+    return os.path.join(directory, f"atn-{key}.pickle")
+
+
+class ATNLoad:
+    def __init__(self, grammar: str, source: str, seconds: float):
+        self.grammar = grammar
+        self.source = source
+        self.seconds = seconds
+
+
+# One entry per ATN built since installATNSnapshots, for --timing=startup.
+atn_loads = []
+
+
+class SnapshotATNDeserializer(ATNDeserializer):
+    """Loads an ATN snapshot instead of deserializing when one exists.
+
+    Snapshots pre-built into `directory` by setup_gen.sh are used first. If
+    there is none, the ATN is deserialized and a snapshot of it is written to
+    cacheDir(), so that the next process can load that instead.
+    """
+
+    directory = GEN_DIR
+    enabled = True
+
+    def deserialize(self, data: str):
+        start = time.perf_counter()
+        source = "snapshot"
+        atn = None
+        if self.enabled:
+            key = atnKey(data)
+            paths = [atnSnapshotPath(key, d) for d in (self.directory, cacheDir())]
+            for path in paths:
+                if (atn := loadSnapshot(path, key)) is not None:
+                    break
+        if atn is None:
+            source = "deserialized"
+            atn = super().deserialize(data)
+            if self.enabled:
+                # A snapshot only saves time next run; failing to write one
+                # (even to start the big-stack thread) must not stop this one
+                try:
+                    dumpSnapshot(paths[-1], key, atn)
+                except Exception as e:
+                    print(f"Could not save ATN snapshot: {e}", file=sys.stderr)
+        grammar = "lexer" if atn.grammarType == ATNType.LEXER else "parser"
+        atn_loads.append(ATNLoad(grammar, source, time.perf_counter() - start))
+        return atn
+
+
+def installATNSnapshots(directory: str = GEN_DIR):
+    """Make generated recognizers imported from now on use ATN snapshots.
+
+    The generated modules deserialize their ATN in the class body, picking up
+    ATNDeserializer through `from antlr4 import *`, so this has to run before
+    gen.CypherLexer and gen.CypherParser are first imported. With
+    CYPHERCHECK_ATN_SNAPSHOT=0 the ATNs are deserialized as usual but load
+    times are still recorded, which makes the two modes easy to compare, and
+    no snapshots are written.
+    """
+    SnapshotATNDeserializer.directory = directory
+    SnapshotATNDeserializer.enabled = os.environ.get(ATN_SNAPSHOT_ENV) != "0"
+    antlr4.ATNDeserializer = SnapshotATNDeserializer
+
+
+def buildATNSnapshots(directory: str = GEN_DIR):
+    from gen import CypherLexer as CypherLexerModule
+    from gen import CypherParser as CypherParserModule
+
+    for module in (CypherLexerModule, CypherParserModule):
+        data = module.serializedATN()
+        key = atnKey(data)
+        atn = ATNDeserializer().deserialize(data)
+        dumpSnapshot(atnSnapshotPath(key, directory), key, atn)
+
+
+def parserKey() -> str:
+    from gen import CypherParser as CypherParserModule
+
+    return atnKey(CypherParserModule.serializedATN())
+
+
+def defaultDFAPath() -> str:
+    return os.path.join(cacheDir(), f"parser-dfa-{parserKey()}.pickle")
+
+
+def dfaStateCount() -> int:
+    from gen.CypherParser import CypherParser
+
+    return sum(len(dfa._states) for dfa in CypherParser.decisionsToDFA)
+
+
+def loadParserDFA(path: str) -> bool:
+    """Install a saved parser ATN/DFA into CypherParser.
+
+    Must run before any CypherParser is constructed, since each parser binds
+    its simulator to the class-level DFA when it is created.
+    """
+    from gen.CypherParser import CypherParser
+
+    payload = loadSnapshot(path, parserKey())
+    if payload is None:
+        return False
+
+    atn = payload["atn"]
+    decisionsToDFA = []
+    for decision, (s0, states) in enumerate(payload["dfas"]):
+        dfa = DFA(atn.decisionToState[decision], decision)
+        dfa.s0 = s0
+        dfa._states = {state: state for state in states}
+        decisionsToDFA.append(dfa)
+
+    CypherParser.atn = atn
+    CypherParser.decisionsToDFA = decisionsToDFA
+    CypherParser.sharedContextCache = payload["contexts"]
+    return True
+
+
+def saveParserDFA(path: str):
+    from gen.CypherParser import CypherParser
+
+    payload = {
+        "atn": CypherParser.atn,
+        "dfas": [
+            (dfa.s0, list(dfa._states)) for dfa in CypherParser.decisionsToDFA
+        ],
+        "contexts": CypherParser.sharedContextCache,
+    }
+    dumpSnapshot(path, parserKey(), payload)
+
+
+def enableDFACache(path: str = None, atExit=atexit.register):
+    """Load the parser DFA from `path` now and write it back at exit.
+
+    The snapshot is only rewritten if this process taught the DFA new states.
+    `atExit` registers the function that does that, for processes that don't
+    run atexit handlers.
+    """
+    path = path or defaultDFAPath()
+    loadParserDFA(path)
+    loaded_states = dfaStateCount()
+
+    def save():
+        if dfaStateCount() > loaded_states:
+            try:
+                saveParserDFA(path)
+            except Exception as e:
+                print(f"Could not save DFA cache {path}: {e}", file=sys.stderr)
+
+    atExit(save)
+
+
+if __name__ == "__main__":
+    buildATNSnapshots()
@@ -0,0 +1,88 @@
+import mmap
+import re
+
+from typing import NamedTuple
+
+from positions import LineIndex
+
+# Files at least this big are scanned through mmap instead of being read
+MMAP_THRESHOLD = 1024 * 1024
+
+# Everything a ';' can hide in, or a ';'. Unterminated strings and comments
+# run to the end of the input, as they would for the lexer.
+_STATEMENT_RE = rb"""'(?:[^'\\]|\\.)*(?:'|\Z)|"(?:[^"\\]|\\.)*(?:"|\Z)|`[^`]*(?:`|\Z)|//[^\n]*|/\*.*?(?:\*/|\Z)|;"""
+_BYTES_RE = re.compile(_STATEMENT_RE, re.DOTALL)
+_TEXT_RE = re.compile(_STATEMENT_RE.decode(), re.DOTALL)
+# A statement with nothing but SP in it
+_BLANK_RE = re.compile(r"(?:\s|//[^\n]*|/\*.*?\*/)*", re.DOTALL)
+
+
+class Statement(NamedTuple):
+    """One ';'-separated statement of a script, without the ';'.
+
+    `line_offset` is the number of lines before the statement, `column` the
+    column it starts at and `offset` its character offset in the script.
+    """
+
+    text: str
+    line_offset: int
+    column: int
+    offset: int
+
+    def lines(self) -> LineIndex:
+        return LineIndex(self.text, self.offset, self.line_offset + 1, self.column)
+
+    def locate(self, diagnostics, lines: LineIndex = None):
+        """Move diagnostics found in this statement to script positions."""
+        lines = lines or self.lines()
+        for d in diagnostics:
+            d.span = (d.span[0] + self.offset, d.span[1] + self.offset)
+            d.line, d.column = lines.position(d.span[0])
+        return diagnostics
+
+
+def _split(data, pattern, decode):
+    line = column = offset = 0
+    start = 0
+    for match in pattern.finditer(data):
+        if match.group() not in (b";", ";"):
+            continue
+        text = decode(data[start : match.start()])
+        if not _BLANK_RE.fullmatch(text):
+            yield Statement(text, line, column, offset)
+
+        # Advance past the statement and its ';'
+        segment = text + ";"
+        newlines = segment.count("\n")
+        if newlines:
+            line += newlines
+            column = len(segment) - segment.rindex("\n") - 1
+        else:
+            column += len(segment)
+        offset += len(segment)
+        start = match.end()
+
+    text = decode(data[start:])
+    if not _BLANK_RE.fullmatch(text):
+        yield Statement(text, line, column, offset)
+
+
+def splitText(text: str):
+    """Yield the Statements in `text`."""
+    yield from _split(text, _TEXT_RE, lambda s: s)
+
+
+def splitFile(path: str):
+    """Yield the Statements in the file at `path`.
+
+    Big files are mapped rather than read, so only the current statement is
+    held in memory as a string.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        if size < MMAP_THRESHOLD:
+            f.seek(0)
+            yield from _split(f.read(), _BYTES_RE, lambda b: b.decode())
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from _split(data, _BYTES_RE, lambda b: b.decode())
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Memory retained per query by ANTLR parse trees versus gen.CypherAST trees."""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from main import getAST
+from slim import toSlim
+
+QUERIES = {
+    "small": "MATCH (n) RETURN n",
+    "medium": (
+        "MATCH (a:Person {name: 'Alice'})-[r:KNOWS*1..3]->(b:Person) "
+        "WITH a, b, count(r) AS hops "
+        "RETURN a.name, b.name, hops * 2 + 1 AS score ORDER BY score DESC LIMIT 10"
+    ),
+    "large": "UNWIND range(1, 10) AS i RETURN "
+    + ", ".join(f"i + {n} * (i - {n}) AS c{n}" for n in range(100)),
+}
+
+
+def retained(build, query, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    trees = [build(query) for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del trees
+    return size / count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    # Warm up the parser's DFA so it doesn't count as tree memory
+    for query in QUERIES.values():
+        getAST(query)
+
+    print(f"{'query':<8} {'antlr':>12} {'slim':>12} {'ratio':>6}")
+    for name, query in QUERIES.items():
+        antlr = retained(getAST, query, args.count)
+        slim = retained(lambda q: toSlim(getAST(q)), query, args.count)
+        print(f"{name:<8} {antlr:>10.0f} B {slim:>10.0f} B {slim / antlr:>6.2f}")
@@ -0,0 +1,243 @@
+#!/usr/bin/python3
+"""Per-phase throughput and latency percentiles over a query corpus.
+
+Lexing (filling the token stream), parsing (parseCypher, as getAST does)
+and analysis (main.analyze) are timed separately for every query in a
+corpus written by corpus.py, and the results are saved as JSON along with
+peak RSS and the startup time of main.py.
+
+With --compare the results are checked against a baseline saved the same
+way (data/baseline.json by default), and the exit status is 1 if phase
+throughput, peak RSS or startup regressed by more than --threshold percent.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..", "..")
+sys.path.insert(0, ROOT)
+
+import main
+from corpus import SEED_CORPUS, loadCorpus
+from parsing import getSession, parseCypher
+
+PHASES = ("lex", "parse", "analyze")
+PERCENTILES = (50, 95, 99)
+BASELINE = os.path.join(HERE, "data", "baseline.json")
+
+
+def lintPhases(session, query: str):
+    """Lint `query`, returning the seconds spent in each phase and how the
+    analysis ended."""
+    start = time.perf_counter()
+    session.setInput(query)
+    session.stream.fill()
+    lexed = time.perf_counter()
+    tree = parseCypher(session.parser)
+    parsed = time.perf_counter()
+    try:
+        # As in main.lint, queries that don't parse aren't analyzed
+        if session.syntax_errors.diagnostics:
+            outcome = "syntax error"
+        else:
+            main.analyze(tree)
+            outcome = "ok"
+    except AssertionError:
+        outcome = "unsupported"
+    except Exception:
+        outcome = "failed"
+    analyzed = time.perf_counter()
+    return (lexed - start, parsed - lexed, analyzed - parsed), outcome
+
+
+def percentile(ordered, p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    total = sum(ordered)
+    summary = {
+        "seconds": total,
+        "throughput": len(ordered) / total if total else 0,
+    }
+    for p in PERCENTILES:
+        summary[f"p{p}_ms"] = percentile(ordered, p) * 1000
+    return summary
+
+
+def gitRevision():
+    try:
+        return subprocess.run(
+            ["git", "-C", ROOT, "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def runCorpus(records, repeat: int, warmup: int):
+    """Lint every record `warmup` + `repeat` times and summarize the timed
+    runs per phase."""
+    session = getSession()
+    samples = {phase: [] for phase in PHASES + ("total",)}
+    outcomes = {}
+    for run in range(warmup + repeat):
+        for record in records:
+            times, outcome = lintPhases(session, record["query"])
+            if run < warmup:
+                continue
+            for phase, seconds in zip(PHASES, times):
+                samples[phase].append(seconds)
+            samples["total"].append(sum(times))
+            if run == warmup:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return {phase: summarize(s) for phase, s in samples.items()}, outcomes
+
+
+def measureStartup(runs: int) -> float:
+    """Best wall time in ms of running main.py on a trivial query."""
+    cmd = [sys.executable, os.path.join(ROOT, "main.py"), "--query", "RETURN 1"]
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def runBenchmark(corpus: str, repeat: int, warmup: int, startup_runs: int) -> dict:
+    header, records = loadCorpus(corpus)
+    phases, outcomes = runCorpus(records, repeat, warmup)
+    return {
+        "corpus": dict(header, path=os.path.relpath(corpus, ROOT)),
+        "revision": gitRevision(),
+        "python": platform.python_version(),
+        "queries": len(records),
+        "repeat": repeat,
+        "outcomes": outcomes,
+        "phases": phases,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "startup_ms": measureStartup(startup_runs) if startup_runs else None,
+    }
+
+
+def printResults(results: dict):
+    outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(results["outcomes"].items()))
+    print(f"{results['queries']} queries x {results['repeat']} ({outcomes})")
+    print(f"{'phase':<8} {'queries/s':>10} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for phase, s in results["phases"].items():
+        print(
+            f"{phase:<8} {s['throughput']:>10.0f} {s['p50_ms']:>7.3f}ms "
+            f"{s['p95_ms']:>7.3f}ms {s['p99_ms']:>7.3f}ms"
+        )
+    print(f"peak RSS: {results['peak_rss_kb'] / 1024:.1f}MB")
+    if results["startup_ms"] is not None:
+        print(f"startup: {results['startup_ms']:.1f}ms")
+
+
+def change(before, after) -> float:
+    """Percent change from `before` to `after`."""
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compareResults(baseline: dict, results: dict, threshold: float):
+    """Print how `results` differ from `baseline` and return the metrics
+    that got worse by more than `threshold` percent."""
+    if baseline["corpus"] != results["corpus"]:
+        print("warning: the baseline was measured on a different corpus")
+
+    regressions = []
+
+    def check(name, before, after, higher_is_better):
+        delta = change(before, after)
+        worse = -delta if higher_is_better else delta
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        return f"{delta:>+7.1f}%{flag}"
+
+    print(f"{'phase':<8} {'metric':<10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for phase, after in results["phases"].items():
+        before = baseline["phases"].get(phase)
+        if before is None:
+            continue
+        for metric in ("throughput",) + tuple(f"p{p}_ms" for p in PERCENTILES):
+            b, a = before[metric], after[metric]
+            if metric == "throughput":
+                result = check(f"{phase} throughput", b, a, True)
+            else:
+                # Latency percentiles are shown but not gated, they are too noisy
+                result = f"{change(b, a):>+7.1f}%"
+            print(f"{phase:<8} {metric:<10} {b:>12.3f} {a:>12.3f} {result}")
+
+    for metric in ("peak_rss_kb", "startup_ms"):
+        before, after = baseline.get(metric), results.get(metric)
+        if before is None or after is None:
+            continue
+        result = check(metric, before, after, False)
+        print(f"{'':<8} {metric:<10} {before:>12.1f} {after:>12.1f} {result}")
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--corpus", default=SEED_CORPUS, metavar="PATH")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs to warm up the DFA"
+    )
+    parser.add_argument(
+        "-o", "--output", default="bench-results.json", metavar="PATH"
+    )
+    parser.add_argument(
+        "--startup-runs",
+        type=int,
+        default=5,
+        metavar="N",
+        help="time main.py startup N times and keep the best (0 to skip)",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE,
+        metavar="BASELINE",
+        help="compare against a saved results file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        metavar="PCT",
+        help="with --compare, fail on regressions bigger than PCT percent",
+    )
+    args = parser.parse_args()
+
+    # The generated parser is recursive, so deep queries need headroom
+    sys.setrecursionlimit(100000)
+    results = runBenchmark(args.corpus, args.repeat, args.warmup, args.startup_runs)
+    printResults(results)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compareResults(baseline, results, args.threshold)
+        if regressions:
+            print(f"regressed by more than {args.threshold}%: {', '.join(regressions)}")
+            sys.exit(1)
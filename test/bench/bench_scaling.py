@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+"""How each phase scales with query size, on synthetic queries.
+
+For every axis in synthetic.py the queries are linted at growing sizes,
+timing the lexer, ParserATNSimulator.adaptivePredict, the rest of the
+parser, visitor.visitor and the whole analysis (Scope), and measuring the
+peak memory of a lint. A power law is fitted to each phase; a slope above
+--threshold on the log-log plot means that phase grows worse than linearly.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import main
+from parsing import getSession, parseCypher
+from synthetic import AXES
+
+PHASES = ("lexer", "adaptivePredict", "parser", "visitor", "scope")
+SIZES = {
+    "clauses": (25, 50, 100, 200, 400),
+    "depth": (10, 20, 40, 80),
+    "predicates": (25, 50, 100, 200, 400),
+    "literal": (500, 1000, 2000, 4000, 8000),
+    "pattern": (10, 20, 40, 80, 160),
+}
+
+
+class PhaseTimer:
+    """Wraps the parser's adaptivePredict and main.visitor to time them."""
+
+    def __init__(self, session):
+        self.predict = 0.0
+        self.visit = 0.0
+        interp = session.parser._interp
+        adaptivePredict = interp.adaptivePredict
+        visitor = main.visitor
+
+        def timedPredict(*args):
+            start = time.perf_counter()
+            try:
+                return adaptivePredict(*args)
+            finally:
+                self.predict += time.perf_counter() - start
+
+        def timedVisitor(*args):
+            start = time.perf_counter()
+            try:
+                return visitor(*args)
+            finally:
+                self.visit += time.perf_counter() - start
+
+        interp.adaptivePredict = timedPredict
+        main.visitor = timedVisitor
+
+    def reset(self):
+        self.predict = 0.0
+        self.visit = 0.0
+
+
+def lintPhases(session, timer: PhaseTimer, query: str):
+    timer.reset()
+    start = time.perf_counter()
+    session.setInput(query)
+    session.stream.fill()
+    lexed = time.perf_counter()
+    tree = parseCypher(session.parser)
+    parsed = time.perf_counter()
+    main.analyze(tree)
+    analyzed = time.perf_counter()
+    return {
+        "lexer": lexed - start,
+        "adaptivePredict": timer.predict,
+        "parser": parsed - lexed - timer.predict,
+        "visitor": timer.visit,
+        "scope": analyzed - parsed,
+    }
+
+
+def peakMemory(query: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    main.lint(query)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def slope(sizes, values) -> float:
+    """Least-squares slope of log(value) against log(size)."""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return 0.0
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    sxy = sum((x - mx) * (y - my) for x, y in points)
+    return sxy / sxx
+
+
+def measureAxis(session, timer, axis: str, sizes, repeat: int):
+    generate = AXES[axis]
+    # Warm up the DFA on the smallest query, so the first size isn't skewed
+    main.lint(generate(sizes[0]))
+    rows = []
+    for size in sizes:
+        query = generate(size)
+        runs = [lintPhases(session, timer, query) for _ in range(repeat)]
+        best = {phase: min(run[phase] for run in runs) for phase in PHASES}
+        rows.append({"size": size, "seconds": best, "peak_bytes": peakMemory(query)})
+    return rows
+
+
+def fitAxis(rows):
+    sizes = [row["size"] for row in rows]
+    fits = {
+        phase: slope(sizes, [row["seconds"][phase] for row in rows])
+        for phase in PHASES
+    }
+    fits["memory"] = slope(sizes, [row["peak_bytes"] for row in rows])
+    return fits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--axis", choices=list(AXES), action="append")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every size by this, e.g. 10 for 100k-item literals",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="flag phases whose log-log slope is above this",
+    )
+    parser.add_argument("-o", "--output", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    # The generated parser is recursive, so deep queries need headroom
+    sys.setrecursionlimit(1000000)
+    session = getSession()
+    timer = PhaseTimer(session)
+
+    results = {}
+    flagged = []
+    print(f"{'axis':<11}" + "".join(f"{p:>16}" for p in PHASES + ("memory",)))
+    for axis in args.axis or list(AXES):
+        sizes = [max(1, round(s * args.scale)) for s in SIZES[axis]]
+        rows = measureAxis(session, timer, axis, sizes, args.repeat)
+        fits = fitAxis(rows)
+        results[axis] = {"rows": rows, "slopes": fits}
+        cells = []
+        for phase, value in fits.items():
+            mark = "!" if value > args.threshold else " "
+            cells.append(f"{value:>15.2f}{mark}")
+            if value > args.threshold:
+                flagged.append(f"{axis}/{phase}")
+        print(f"{axis:<11}" + "".join(cells))
+
+    if flagged:
+        print(f"superlinear (slope > {args.threshold}): {', '.join(flagged)}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
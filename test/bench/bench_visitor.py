@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""Nodes/sec of visitor.visitor against the old recursive implementation."""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from main import getAST
+from visitor import visitor
+
+
+def recursiveVisitor(ctx, f):
+    # visitor.visitor as it was before it became iterative
+    if not f(ctx):
+        return
+    try:
+        children = ctx.children
+        if not children:
+            children = []
+    except AttributeError:
+        children = []
+
+    for c in children:
+        recursiveVisitor(c, f)
+
+
+def andChain(n):
+    predicates = " AND ".join(f"n.p{i} = {i}" for i in range(n))
+    return f"MATCH (n) RETURN {predicates}"
+
+
+def nestedList(depth):
+    return f"RETURN {'[' * depth}1{']' * depth}"
+
+
+def bench(walk, tree, repeat):
+    nodes = 0
+
+    def count(ctx):
+        nonlocal nodes
+        nodes += 1
+        return True
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        walk(tree, count)
+    return nodes / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # The generated parser is itself recursive, so deep inputs need headroom
+    # just to be parsed.
+    sys.setrecursionlimit(100000)
+    queries = {
+        "and-chain-500": andChain(500),
+        "nested-list-50": nestedList(50),
+    }
+
+    print(f"{'query':<16} {'recursive':>14} {'iterative':>14} {'speedup':>8}")
+    for name, query in queries.items():
+        tree = getAST(query)
+        before = bench(recursiveVisitor, tree, args.repeat)
+        after = bench(visitor, tree, args.repeat)
+        print(
+            f"{name:<16} {before:>10.0f} n/s {after:>10.0f} n/s "
+            f"{after / before:>7.2f}x"
+        )
+
+    # A tree deeper than the default recursion limit
+    tree = getAST(nestedList(200))
+    sys.setrecursionlimit(1000)
+    for name, walk in (("recursive", recursiveVisitor), ("iterative", visitor)):
+        try:
+            walk(tree, lambda ctx: True)
+            print(f"nested-list-200 {name}: ok")
+        except RecursionError:
+            print(f"nested-list-200 {name}: RecursionError")
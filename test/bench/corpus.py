@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+"""Extract the queries from openCypher TCK .feature files into a JSONL corpus.
+
+The first line of a corpus is a header with the corpus format version and
+where it came from; every other line is one query:
+
+    {"id": "clauses/match/Match1.feature:42", "step": "query", "query": "..."}
+
+Queries in Scenario Outlines are expanded with each row of their Examples
+tables, and get the row number appended to their id.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import textwrap
+
+# Bump when the extraction changes in a way that changes the corpus
+CORPUS_VERSION = 1
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA = os.path.join(HERE, "data")
+SEED_CORPUS = os.path.join(DATA, "seed.jsonl")
+
+_STEPS = {
+    "executing query:": "query",
+    "executing control query:": "control",
+    "having executed:": "setup",
+}
+_PLACEHOLDER_RE = re.compile(r"<(\w+)>")
+
+
+def _tableRow(line: str):
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def extractQueries(path: str, name: str):
+    """Yield a record per query in the .feature file at `path`."""
+    with open(path) as f:
+        lines = f.read().split("\n")
+
+    outline = []
+    examples = False
+    header = None
+    rows = 0
+    i = 0
+    while i < len(lines):
+        stripped = lines[i].strip()
+        if stripped.startswith(("Scenario:", "Scenario Outline:", "Feature:")):
+            outline = []
+            examples = False
+        elif stripped.startswith("Examples:"):
+            examples = True
+            header = None
+            rows = 0
+        elif stripped.startswith("|") and examples:
+            if header is None:
+                header = _tableRow(stripped)
+            else:
+                rows += 1
+                values = dict(zip(header, _tableRow(stripped)))
+                for record in outline:
+                    query = _PLACEHOLDER_RE.sub(
+                        lambda m: values.get(m.group(1), m.group(0)), record["query"]
+                    )
+                    yield dict(record, id=f"{record['id']}#{rows}", query=query)
+        else:
+            step = next((s for e, s in _STEPS.items() if stripped.endswith(e)), None)
+            if step and i + 1 < len(lines) and lines[i + 1].strip() == '"""':
+                start = i + 2
+                end = start
+                while end < len(lines) and lines[end].strip() != '"""':
+                    end += 1
+                query = textwrap.dedent("\n".join(lines[start:end]))
+                record = {"id": f"{name}:{i + 1}", "step": step, "query": query}
+                if _PLACEHOLDER_RE.search(query):
+                    outline.append(record)
+                else:
+                    yield record
+                i = end
+        i += 1
+
+
+def sourceRevision(directory: str):
+    try:
+        return subprocess.run(
+            ["git", "-C", directory, "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def extractCorpus(features: str):
+    """(header, records) for every .feature file under `features`."""
+    records = []
+    for root, dirs, files in os.walk(features):
+        dirs.sort()
+        for f in sorted(files):
+            if f.endswith(".feature"):
+                path = os.path.join(root, f)
+                name = os.path.relpath(path, features)
+                records.extend(extractQueries(path, name))
+    header = {
+        "corpus": "tck",
+        "version": CORPUS_VERSION,
+        "revision": sourceRevision(features),
+        "queries": len(records),
+    }
+    return header, records
+
+
+def writeCorpus(path: str, header: dict, records):
+    with open(path, "w") as f:
+        f.write(json.dumps(header) + "\n")
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def loadCorpus(path: str):
+    """(header, records) from a corpus file."""
+    with open(path) as f:
+        header = json.loads(f.readline())
+        if header.get("version") != CORPUS_VERSION:
+            raise ValueError(
+                f"{path} is corpus version {header.get('version')}, "
+                f"expected {CORPUS_VERSION}; extract it again"
+            )
+        records = [json.loads(line) for line in f if line.strip()]
+    return header, records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "features",
+        nargs="?",
+        default=os.path.join(HERE, "..", "..", "openCypher", "tck", "features"),
+        help="directory of .feature files",
+    )
+    parser.add_argument(
+        "-o", "--output", default=os.path.join(DATA, "tck.jsonl"), metavar="PATH"
+    )
+    args = parser.parse_args()
+
+    header, records = extractCorpus(args.features)
+    writeCorpus(args.output, header, records)
+    print(f"{len(records)} queries written to {args.output}")
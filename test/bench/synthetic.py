@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""Synthetic queries that grow along one size axis at a time."""
+import argparse
+
+
+def clauses(n: int) -> str:
+    """A script of n CREATE clauses."""
+    creates = " ".join(f"CREATE (n{i}:Node {{i: {i}}})" for i in range(n))
+    return f"{creates} RETURN n0"
+
+
+def depth(n: int) -> str:
+    """An arithmetic expression nested n parentheses deep."""
+    return f"UNWIND [1] AS x RETURN {'(' * n}x{' + 1)' * n} AS y"
+
+
+def predicates(n: int) -> str:
+    """An AND chain of n comparisons."""
+    chain = " AND ".join(f"n.p{i} = {i}" for i in range(n))
+    return f"MATCH (n) RETURN {chain} AS ok"
+
+
+def literal(n: int) -> str:
+    """A list literal with n items."""
+    return f"RETURN [{', '.join(str(i) for i in range(n))}] AS l"
+
+
+def pattern(n: int) -> str:
+    """A path pattern through n nodes."""
+    path = "-[:R]->".join(f"(n{i})" for i in range(n))
+    return f"MATCH {path} RETURN n0, n{n - 1}"
+
+
+AXES = {
+    "clauses": clauses,
+    "depth": depth,
+    "predicates": predicates,
+    "literal": literal,
+    "pattern": pattern,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("axis", choices=list(AXES))
+    parser.add_argument("size", type=int)
+    args = parser.parse_args()
+    print(AXES[args.axis](args.size))
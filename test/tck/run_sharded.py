@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+"""Run the openCypher TCK with behave in parallel shards and merge the results.
+
+Sets up features/ the way run.sh does, splits the feature files across
+--jobs behave processes, and writes one report with the status and wall
+time of every scenario. Scenarios that fail on an unsupported query are
+counted separately from real failures.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..", "..")
+FEATURES = os.path.join(HERE, "features")
+
+
+def setupFeatures(source: str):
+    shutil.rmtree(FEATURES, ignore_errors=True)
+    shutil.copytree(source, FEATURES)
+    os.makedirs(os.path.join(FEATURES, "steps"), exist_ok=True)
+    shutil.copy(os.path.join(HERE, "steps.py"), os.path.join(FEATURES, "steps"))
+
+
+def findFeatures():
+    found = []
+    for root, dirs, files in os.walk(FEATURES):
+        dirs.sort()
+        for f in sorted(files):
+            if f.endswith(".feature"):
+                found.append(os.path.join(root, f))
+    return found
+
+
+def shard(paths, count: int):
+    """Split `paths` into `count` lists of about the same total size."""
+    shards = [[] for _ in range(count)]
+    sizes = [0] * count
+    for path in sorted(paths, key=os.path.getsize, reverse=True):
+        i = sizes.index(min(sizes))
+        shards[i].append(path)
+        sizes[i] += os.path.getsize(path)
+    return [sorted(s) for s in shards if s]
+
+
+def startShard(paths, output: str, stop: bool):
+    cmd = [sys.executable, "-m", "behave", "--format", "json", "--outfile", output]
+    cmd += ["--no-summary", "--no-capture"]
+    if stop:
+        cmd.append("--stop")
+    main = os.path.realpath(os.path.join(ROOT, "main.py"))
+    env = dict(os.environ, CYPHERCHECK=main)
+    return subprocess.Popen(cmd + paths, cwd=HERE, env=env, stdout=subprocess.DEVNULL)
+
+
+def errorMessage(step) -> str:
+    message = step.get("result", {}).get("error_message") or ""
+    if isinstance(message, list):
+        message = "\n".join(message)
+    return message
+
+
+def scenarioResults(report):
+    """Yield one record per scenario in a behave JSON report."""
+    for feature in report:
+        for element in feature.get("elements", []):
+            if element.get("type") != "scenario":
+                continue
+            steps = element.get("steps", [])
+            status = element.get("status", "untested")
+            messages = [errorMessage(step) for step in steps]
+            if status == "failed" and any("Unsupported query" in m for m in messages):
+                status = "unsupported"
+            results = [step.get("result", {}) for step in steps]
+            seconds = sum(result.get("duration", 0) for result in results)
+            yield {
+                "feature": feature.get("name"),
+                "scenario": element.get("name"),
+                "location": element.get("location"),
+                "status": status,
+                "seconds": seconds,
+            }
+
+
+def run(args) -> int:
+    if not args.no_setup:
+        setupFeatures(args.source)
+    shards = shard(findFeatures(), args.jobs)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        procs = []
+        for i, paths in enumerate(shards):
+            output = os.path.join(tmp, f"shard-{i}.json")
+            procs.append((startShard(paths, output, args.stop), output))
+
+        scenarios = []
+        crashed = 0
+        for proc, output in procs:
+            proc.wait()
+            try:
+                with open(output) as f:
+                    scenarios.extend(scenarioResults(json.load(f)))
+            except (OSError, ValueError):
+                # behave died before writing a report
+                crashed += 1
+    elapsed = time.perf_counter() - start
+
+    totals = {}
+    for scenario in scenarios:
+        totals[scenario["status"]] = totals.get(scenario["status"], 0) + 1
+
+    with open(args.report, "w") as f:
+        json.dump(
+            {
+                "shards": len(shards),
+                "seconds": elapsed,
+                "totals": totals,
+                "scenarios": scenarios,
+            },
+            f,
+            indent=2,
+        )
+
+    print(f"{len(scenarios)} scenarios in {elapsed:.1f}s over {len(shards)} shards")
+    for status, count in sorted(totals.items()):
+        print(f"  {status}: {count}")
+    slowest = sorted(scenarios, key=lambda s: s["seconds"], reverse=True)
+    for scenario in slowest[: args.slowest]:
+        print(f"  {scenario['seconds'] * 1000:8.1f}ms {scenario['location']}")
+    if crashed:
+        print(f"{crashed} shards did not produce a report", file=sys.stderr)
+
+    return 1 if crashed or totals.get("failed") else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--source",
+        default=os.path.join(ROOT, "openCypher", "tck", "features"),
+        help="openCypher TCK features directory to copy from",
+    )
+    parser.add_argument(
+        "--no-setup",
+        action="store_true",
+        help="use the features/ directory as it is instead of copying it again",
+    )
+    parser.add_argument(
+        "--stop", action="store_true", help="stop each shard at its first failure"
+    )
+    parser.add_argument("--report", default="tck-report.json", metavar="PATH")
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=10,
+        metavar="N",
+        help="list the N slowest scenarios",
+    )
+    sys.exit(run(parser.parse_args()))
@@ -1,8 +1,43 @@
+import io
 import os
 import subprocess
+import sys
 
 from behave import given, when, then, step
 
+# Queries are linted in this process through batch.lintOne unless
+# CYPHERCHECK_SUBPROCESS is set, which runs $CYPHERCHECK per query instead
+IN_PROCESS = not os.environ.get('CYPHERCHECK_SUBPROCESS')
+
+if IN_PROCESS:
+    sys.path.insert(0, os.path.dirname(os.environ['CYPHERCHECK']))
+    import batch
+    from diagnostics import TextRenderer
+    from positions import LineIndex
+
+
+class Execution:
+    """The stderr and exit status main.py would have had for a query."""
+
+    def __init__(self, stderr, returncode):
+        self.stderr = stderr
+        self.returncode = returncode
+
+
+def lint_in_process(query):
+    result = batch.lintOne('<query>', query)
+    stderr = io.StringIO()
+    renderer = TextRenderer(stderr)
+    renderer.add(None, LineIndex(query), result.diagnostics, result.message)
+    renderer.close()
+    return Execution(stderr.getvalue(), 0 if result.ok else 1)
+
+
+def lint_in_subprocess(query):
+    cmd = [os.environ['CYPHERCHECK'], '--query', query]
+    proc = subprocess.run(cmd, stderr=subprocess.PIPE)
+    return Execution(proc.stderr.decode(), proc.returncode)
+
 
 @given('an empty graph')
 @given('any graph')
@@ -19,10 +54,10 @@ def step_impl(context, **kwargs):
 @when('executing control query')
 @when('executing query')
 def executing_query(context):
-    exe_path = os.environ['CYPHERCHECK']
-    cmd = [exe_path, '--query', context.text]
-    context.proc = subprocess.Popen(
-        cmd, stderr=subprocess.PIPE)
+    if IN_PROCESS:
+        context.execution = lint_in_process(context.text)
+    else:
+        context.execution = lint_in_subprocess(context.text)
 
 
 @given('parameter values are')
@@ -39,12 +74,11 @@ def params_wrapper_2(context):
 def syntax_error(context, error):
     if error != 'UndefinedVariable':
         return
-    context.proc.wait()
-    stderr = context.proc.stderr.read().decode()
+    stderr = context.execution.stderr
     if 'Unsupported query' in stderr:
         raise Exception('Unsupported query {}'.format(stderr))
     assert 'UndefinedVariable' in stderr
-    assert context.proc.returncode != 0
+    assert context.execution.returncode != 0
 
 
 @then('the result should be empty')
@@ -57,8 +91,7 @@ def syntax_error(context, error):
 @then('{errorType} should be raised at any time: {error}')
 @then('{errorType} should be raised at compile time: {error}')
 def step_impl(context, **kwargs):
-    context.proc.wait()
-    stderr = context.proc.stderr.read().decode()
+    stderr = context.execution.stderr
     if 'Unsupported query' in stderr:
         raise Exception('Unsupported query {}'.format(stderr))
     assert not stderr
@@ -1,25 +1,101 @@
+from bisect import bisect_left
+
+from antlr4 import ParserRuleContext
+
+import instrument
+from gen.CypherAST import Node
+from gen.CypherMayContain import MAY_CONTAIN
+
+# Nodes that can have children, in ANTLR and gen.CypherAST trees
+RULE_NODES = (ParserRuleContext, Node)
+
+
+def _counted(f):
+    counters = instrument.stats.counters
+
+    def visit(ctx):
+        counters["nodes visited"] += 1
+        return f(ctx)
+
+    return visit
+
+
 def visitor(ctx, f):
-    if not f(ctx):
-        return
-    try:
-        children = ctx.children
-        if not children:
-            children = []
-    except AttributeError:
-        children = []
+    # Pre-order walk with an explicit stack; f returning False prunes the
+    # subtree below that node.
+    if instrument.stats.enabled:
+        f = _counted(f)
+    stack = [ctx]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        ctx = pop()
+        if f(ctx) and isinstance(ctx, RULE_NODES):
+            children = ctx.children
+            if children:
+                # Most rule nodes are single-child wrappers
+                if len(children) == 1:
+                    push(children[0])
+                else:
+                    extend(children[::-1])
+
+
+def spanText(ctx) -> str:
+    """Text of `ctx`, sliced out of the parsed input.
+
+    ParserRuleContext.getText concatenates the text of every descendant, so
+    calling it on nested expressions is quadratic overall. The Cypher lexer
+    keeps whitespace and comments in the tree, so slicing the input from the
+    first to the last token gives the same string. The result is memoized on
+    the node.
+    """
+    if not isinstance(ctx, ParserRuleContext):
+        return ctx.getText()
+    text = getattr(ctx, "_spanText", None)
+    if text is None:
+        start, stop = ctx.start, ctx.stop
+        if start is None or stop is None or stop.stop < start.start:
+            text = ""
+        else:
+            text = start.getInputStream().getText(start.start, stop.stop)
+        ctx._spanText = text
+    return text
+
+
+_may_contain = {}
 
-    for c in children:
-        visitor(c, f)
+
+def mayContain(ctx, types) -> bool:
+    """Whether the subtree below `ctx` can contain a node of one of `types`.
+
+    Answered from the grammar, so callers can skip subtrees that could never
+    match. Nodes of rules missing from the table are assumed to match.
+    """
+    table = _may_contain.get(types)
+    if table is None:
+        names = {
+            type_.__name__
+            for type_ in (types if isinstance(types, tuple) else (types,))
+        }
+        table = {
+            ctx_name: not names.isdisjoint(reachable)
+            for ctx_name, reachable in MAY_CONTAIN.items()
+        }
+        _may_contain[types] = table
+    return table.get(type(ctx).__name__, True)
 
 
 def hasType(ctx, type_):
     found_merge = False
     def helper(ctx):
         nonlocal found_merge
+        if found_merge:
+            return False
         if isinstance(ctx, type_):
             found_merge = True
             return False
-        return True
+        return mayContain(ctx, type_)
 
     visitor(ctx, helper)
     return found_merge
@@ -32,7 +108,80 @@ def getType(ctx, type_):
         if isinstance(ctx, type_):
             ctxs.append(ctx)
             return False
-        return True
+        return mayContain(ctx, type_)
 
     visitor(ctx, helper)
     return ctxs
+
+
+class NodeIndex:
+    """Every node under `root`, grouped by class, from a single walk.
+
+    Nodes are numbered in document order and each one remembers where its
+    subtree ends, so hasType/getType for any subtree of `root` only look at
+    the nodes of the requested types instead of walking the subtree.
+    """
+
+    def __init__(self, root):
+        self.spans = {}
+        self.positions = {}
+        self.nodes = {}
+        self._classes = {}
+
+        count = 0
+        stack = [(root, False)]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                self.spans[node] = (self.spans[node], count)
+                continue
+
+            self.spans[node] = count
+            cls = type(node)
+            if cls not in self.positions:
+                self.positions[cls] = []
+                self.nodes[cls] = []
+            self.positions[cls].append(count)
+            self.nodes[cls].append(node)
+            count += 1
+
+            stack.append((node, True))
+            if isinstance(node, RULE_NODES) and node.children:
+                for child in reversed(node.children):
+                    stack.append((child, False))
+
+    def classes(self, type_):
+        if type_ not in self._classes:
+            self._classes[type_] = [
+                cls for cls in self.positions if issubclass(cls, type_)
+            ]
+        return self._classes[type_]
+
+    def hasType(self, ctx, type_) -> bool:
+        first, end = self.spans[ctx]
+        for cls in self.classes(type_):
+            positions = self.positions[cls]
+            i = bisect_left(positions, first)
+            if i < len(positions) and positions[i] < end:
+                return True
+        return False
+
+    def getType(self, ctx, type_):
+        first, end = self.spans[ctx]
+        found = []
+        for cls in self.classes(type_):
+            positions = self.positions[cls]
+            lo = bisect_left(positions, first)
+            hi = bisect_left(positions, end, lo)
+            found.extend(self.nodes[cls][lo:hi])
+        found.sort(key=lambda node: self.spans[node][0])
+
+        # Like getType, don't report matches nested inside another match
+        ctxs = []
+        covered = first
+        for node in found:
+            node_first, node_end = self.spans[node]
+            if node_first >= covered:
+                ctxs.append(node)
+                covered = node_end
+        return ctxs